@@ -725,8 +725,13 @@ class FileSystemHandler:
         logger.info("Permissions set successfully.")
         return True
 
-    def download_file(self, url: str, destination_path: Path, overwrite: bool = False, quiet: bool = False) -> bool:
-        """Downloads a file from a URL to a destination path."""
+    def download_file(self, url: str, destination_path: Path, overwrite: bool = False, quiet: bool = False, hash_obj=None, session=None) -> bool:
+        """Downloads a file from a URL to a destination path.
+
+        If hash_obj (e.g. hashlib.sha256()) is given, it is updated with every chunk as it is written,
+        so the caller can verify the download without re-reading the file.
+        An optional requests.Session can be passed to reuse pooled connections.
+        """
         self.logger.info(f"Downloading {url} to {destination_path}...")
         
         if not overwrite and destination_path.exists():
@@ -741,11 +746,14 @@ class FileSystemHandler:
             destination_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Perform the download with streaming
-            with requests.get(url, stream=True, timeout=300, verify=True) as r:
+            http = session if session is not None else requests
+            with http.get(url, stream=True, timeout=300, verify=True) as r:
                 r.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-                with open(destination_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                with open(destination_path, 'wb', buffering=1024 * 1024) as f:
+                    for chunk in r.iter_content(chunk_size=64 * 1024):
                         f.write(chunk)
+                        if hash_obj is not None:
+                            hash_obj.update(chunk)
                         
             self.logger.info("Download complete.")
             # Only print if not quiet
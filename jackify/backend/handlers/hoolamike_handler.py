@@ -1,12 +1,25 @@
+import datetime
+import functools
+import hashlib
 import logging
 import os
+import re
+import selectors
+import shutil
+import stat
 import subprocess
-import zipfile
-import tarfile
+import tempfile
 from pathlib import Path
 import yaml # Assuming PyYAML is installed
 from typing import Dict, Optional, List
-import requests
+
+# Prefer the libyaml C bindings when PyYAML was built with them (much faster parse/emit)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+    _LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+    _LIBYAML_AVAILABLE = False
 
 # Import necessary handlers from the current Jackify structure
 from .path_handler import PathHandler
@@ -20,6 +33,8 @@ from .status_utils import show_status, clear_status
 from .subprocess_utils import get_clean_subprocess_env
 
 logger = logging.getLogger(__name__)
+if not _LIBYAML_AVAILABLE:
+    logger.debug("PyYAML was built without libyaml; hoolamike.yaml will use the pure-Python loader/dumper.")
 
 # Define default Hoolamike AppIDs for relevant games
 TARGET_GAME_APPIDS = {
@@ -30,17 +45,92 @@ TARGET_GAME_APPIDS = {
     'Fallout 4': '377160'
 }
 
+# Game names as Hoolamike expects them in hoolamike.yaml (no spaces)
+_GAME_NAME_MAP = {
+    "Fallout 3": "Fallout3",
+    "Fallout New Vegas": "FalloutNewVegas",
+    "Skyrim Special Edition": "SkyrimSpecialEdition",
+    "Fallout 4": "Fallout4",
+    "Oblivion": "Oblivion"  # No change needed
+}
+# TARGET_GAME_APPIDS keyed by the Hoolamike-formatted game name
+_FORMATTED_TARGET_APPIDS = {_GAME_NAME_MAP[name]: appid for name, appid in TARGET_GAME_APPIDS.items()}
+
 # Define the expected name of the native Hoolamike executable
 HOOLAMIKE_EXECUTABLE_NAME = "hoolamike" # Assuming this is the binary name
+# Resolve the home directory once per process ($HOME first, avoiding a pwd lookup)
+_HOME = Path(os.environ.get("HOME") or Path.home())
 # Keep consistent with logs directory - use ~/Jackify/ for user-visible managed components
-JACKIFY_BASE_DIR = Path.home() / "Jackify"
+JACKIFY_BASE_DIR = _HOME / "Jackify"
 # Use Jackify base directory for ALL Hoolamike-related files to centralize management
 DEFAULT_HOOLAMIKE_APP_INSTALL_DIR = JACKIFY_BASE_DIR / "Hoolamike"
 HOOLAMIKE_CONFIG_DIR = DEFAULT_HOOLAMIKE_APP_INSTALL_DIR
 HOOLAMIKE_CONFIG_FILENAME = "hoolamike.yaml"
 # Default dirs for other components
 DEFAULT_HOOLAMIKE_DOWNLOADS_DIR = JACKIFY_BASE_DIR / "Mod_Downloads"
-DEFAULT_MODLIST_INSTALL_BASE_DIR = Path.home() / "ModdedGames"
+DEFAULT_MODLIST_INSTALL_BASE_DIR = _HOME / "ModdedGames"
+
+# Process-wide cache of detected game paths, invalidated when any libraryfolders.vdf changes
+_GAME_PATHS_CACHE: Optional[Dict[str, Path]] = None
+_GAME_PATHS_STAMP: Optional[tuple] = None
+# Linux x86_64 release assets (tar preferred over zip), excluding other architectures
+_ASSET_RE = re.compile(
+    r"^(?!.*(?:arm|aarch64|darwin))(?=.*linux)(?=.*(?:x86_64|amd64)).*\.(?P<kind>tar\.gz|tgz|zip)$"
+)
+_ASSET_KIND_PRIORITY = {"tar.gz": 0, "tgz": 0, "zip": 1}
+# Editors offered by edit_hoolamike_config (in addition to $EDITOR)
+_AVAILABLE_EDITORS = ("nano", "vim", "vi", "gedit", "kate", "micro")
+# Read size for archive extraction I/O (fewer, larger reads than the 16 KiB default)
+_ARCHIVE_IO_BUFSIZE = 1 << 20
+
+_HTTP_SESSION = None
+
+def _get_http_session():
+    """Shared requests.Session for GitHub calls so the API request and asset download reuse pooled connections."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "Jackify"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("https://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+class _HashingReader:
+    """Minimal read-only file wrapper that feeds every chunk read into a hash object."""
+
+    def __init__(self, raw, hash_obj):
+        self._raw = raw
+        self._hash = hash_obj
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        if data:
+            self._hash.update(data)
+        return data
+
+def _expected_sha256(asset: Dict) -> Optional[str]:
+    """Return the asset's published SHA256 (GitHub 'digest' field, 'sha256:<hex>'), if any."""
+    digest = asset.get('digest') or ''
+    algo, _, value = digest.partition(':')
+    if algo.lower() == 'sha256' and value:
+        return value.lower()
+    return None
+
+def _is_dir_nonempty(path: Path) -> bool:
+    """True if the directory has at least one entry; stops after the first one instead of listing everything."""
+    with os.scandir(path) as it:
+        return next(it, None) is not None
+
+def _is_executable_file(path: Path) -> bool:
+    """Single stat() check for a regular file with any execute bit set."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
 
 class HoolamikeHandler:
     """Handles discovery, configuration, and execution of Hoolamike tasks.
@@ -66,6 +156,10 @@ class HoolamikeHandler:
         self.hoolamike_installed: bool = False
         self.hoolamike_config_path: Path = HOOLAMIKE_CONFIG_DIR / HOOLAMIKE_CONFIG_FILENAME
         self.hoolamike_config: Optional[Dict] = None
+        self._dirs_ensured: bool = False # Set once base dirs are created; reset when install path changes
+        self._config_dirty: bool = False # In-memory config differs from hoolamike.yaml on disk
+        self._detected_games_cache: Optional[Dict[str, Path]] = None # Vanilla game dirs for the current install flow
+        self._editor_cache: Optional[Dict[str, str]] = None # Editors found on PATH, resolved once per session
 
         # Load Hoolamike install path from Jackify config if it exists
         saved_path_str = self.config_handler.get('hoolamike_install_path')
@@ -78,11 +172,14 @@ class HoolamikeHandler:
 
     def _ensure_hoolamike_dirs_exist(self):
         """Ensure base directories for Hoolamike exist."""
+        if self._dirs_ensured:
+            return
         try:
             HOOLAMIKE_CONFIG_DIR.mkdir(parents=True, exist_ok=True) # Separate Hoolamike config
             self.hoolamike_app_install_path.mkdir(parents=True, exist_ok=True) # Install dir (~/Jackify/Hoolamike)
             # Default downloads dir also needs to exist if we reference it
             DEFAULT_HOOLAMIKE_DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
+            self._dirs_ensured = True
         except OSError as e:
             self.logger.error(f"Error creating Hoolamike directories: {e}", exc_info=True)
             # Decide how to handle this - maybe raise an exception?
@@ -93,7 +190,7 @@ class HoolamikeHandler:
         """
         potential_exe_path = self.hoolamike_app_install_path / HOOLAMIKE_EXECUTABLE_NAME
         check_path = None 
-        if potential_exe_path.is_file() and os.access(potential_exe_path, os.X_OK):
+        if _is_executable_file(potential_exe_path):
             check_path = potential_exe_path
             self.logger.info(f"Found Hoolamike at current path: {check_path}")
         else:
@@ -107,11 +204,33 @@ class HoolamikeHandler:
             self.hoolamike_installed = False
             self.hoolamike_executable_path = None
 
-    def _generate_default_config(self) -> Dict:
-        """Generates the default configuration dictionary."""
-        self.logger.info("Generating default Hoolamike config structure.")
-        # Detection is now handled separately after loading config
+    def _find_target_game_paths(self) -> Dict[str, Path]:
+        """Return install paths for TARGET_GAME_APPIDS, reusing the cached scan while Steam's library list is unchanged."""
+        global _GAME_PATHS_CACHE, _GAME_PATHS_STAMP
+        stamp = self.path_handler.get_libraryfolders_vdf_stamp()
+        if _GAME_PATHS_CACHE is not None and stamp == _GAME_PATHS_STAMP:
+            self.logger.debug("Using cached game install paths.")
+            return dict(_GAME_PATHS_CACHE)
         detected_paths = self.path_handler.find_game_install_paths(TARGET_GAME_APPIDS)
+        _GAME_PATHS_CACHE = dict(detected_paths)
+        _GAME_PATHS_STAMP = stamp
+        return detected_paths
+
+    def _get_detected_games(self, force: bool = False) -> Dict[str, Path]:
+        """Return vanilla game directories, scanning Steam libraries only once per install flow."""
+        if force or self._detected_games_cache is None:
+            self._detected_games_cache = self.path_handler.find_vanilla_game_paths()
+        return self._detected_games_cache
+
+    def _generate_default_config(self, detected_paths: Optional[Dict[str, Path]] = None) -> Dict:
+        """Generates the default configuration dictionary.
+
+        Args:
+            detected_paths: Already-detected game paths to reuse; detection only runs when omitted.
+        """
+        self.logger.info("Generating default Hoolamike config structure.")
+        if detected_paths is None:
+            detected_paths = self._find_target_game_paths()
 
         config = {
             "downloaders": {
@@ -149,21 +268,8 @@ class HoolamikeHandler:
         
         Hoolamike expects game names without spaces like: Fallout3, FalloutNewVegas, SkyrimSpecialEdition
         """
-        # Handle specific game name formats that Hoolamike expects
-        game_name_map = {
-            "Fallout 3": "Fallout3",
-            "Fallout New Vegas": "FalloutNewVegas",
-            "Skyrim Special Edition": "SkyrimSpecialEdition",
-            "Fallout 4": "Fallout4",
-            "Oblivion": "Oblivion"  # No change needed
-        }
-        
-        # Use predefined mapping if available
-        if game_name in game_name_map:
-            return game_name_map[game_name]
-        
-        # Otherwise, just remove spaces as fallback
-        return game_name.replace(" ", "")
+        # Use predefined mapping if available, otherwise just remove spaces as fallback
+        return _GAME_NAME_MAP.get(game_name, game_name.replace(" ", ""))
 
     def _load_hoolamike_config(self):
         """Load hoolamike.yaml if it exists, or generate a default one."""
@@ -172,11 +278,14 @@ class HoolamikeHandler:
         if self.hoolamike_config_path.is_file():
             self.logger.info(f"Found existing hoolamike.yaml at {self.hoolamike_config_path}. Loading...")
             try:
-                with open(self.hoolamike_config_path, 'r', encoding='utf-8') as f:
-                    self.hoolamike_config = yaml.safe_load(f)
+                # Single read, then let libyaml parse the raw bytes (it detects the encoding itself)
+                with open(self.hoolamike_config_path, 'rb') as f:
+                    data = f.read()
+                self.hoolamike_config = yaml.load(data, Loader=_YamlLoader)
                 if not isinstance(self.hoolamike_config, dict):
                     self.logger.warning(f"Failed to parse hoolamike.yaml as a dictionary. Generating default.")
-                    self.hoolamike_config = self._generate_default_config()
+                    self.game_install_paths = self._find_target_game_paths()
+                    self.hoolamike_config = self._generate_default_config(self.game_install_paths)
                     self.save_hoolamike_config() # Save the newly generated default
                 else:
                     self.logger.info("Successfully loaded hoolamike.yaml configuration.")
@@ -193,7 +302,9 @@ class HoolamikeHandler:
                 return False
         else:
             self.logger.info(f"hoolamike.yaml not found at {self.hoolamike_config_path}. Generating default configuration.")
-            self.hoolamike_config = self._generate_default_config()
+            # Detect once here; _detect_and_update_game_paths reuses the result
+            self.game_install_paths = self._find_target_game_paths()
+            self.hoolamike_config = self._generate_default_config(self.game_install_paths)
             self.save_hoolamike_config()
         
         return True
@@ -207,13 +318,30 @@ class HoolamikeHandler:
          self._ensure_hoolamike_dirs_exist() # Ensure parent dir exists
          self.logger.info(f"Saving configuration to {self.hoolamike_config_path}")
          try:
-             with open(self.hoolamike_config_path, 'w', encoding='utf-8') as f:
-                # Add comments conditionally
-                f.write("# Configuration file created or updated by Jackify\n")
-                if not self.hoolamike_config.get("games"):
-                    f.write("# No games were detected by Jackify. Add game paths manually if needed.\n")
-                # Dump the actual YAML
-                yaml.dump(self.hoolamike_config, f, default_flow_style=False, sort_keys=False)
+             # Add comments conditionally
+             output = "# Configuration file created or updated by Jackify\n"
+             if not self.hoolamike_config.get("games"):
+                 output += "# No games were detected by Jackify. Add game paths manually if needed.\n"
+             # Dump the actual YAML into memory, then write the whole file in one go
+             output += yaml.dump(self.hoolamike_config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+             # Write to a unique temp file in the same directory, flush it to disk and swap it in,
+             # so a crash never leaves a torn or empty hoolamike.yaml
+             tmp = tempfile.NamedTemporaryFile('wb', dir=self.hoolamike_config_path.parent,
+                                               prefix=".hoolamike.", suffix=".tmp", delete=False)
+             try:
+                 with tmp:
+                     tmp.write(output.encode('utf-8'))
+                     tmp.flush()
+                     os.fsync(tmp.fileno())
+                 os.chmod(tmp.name, 0o644) # NamedTemporaryFile creates 0600
+                 os.replace(tmp.name, self.hoolamike_config_path)
+             except BaseException:
+                 try:
+                     os.unlink(tmp.name)
+                 except OSError:
+                     pass
+                 raise
+             self._config_dirty = False
              self.logger.info("Configuration saved successfully.")
              return True
          except Exception as e:
@@ -226,33 +354,38 @@ class HoolamikeHandler:
 
         # Detect game paths and update internal state + config
         self._detect_and_update_game_paths()
+        # Only re-serialize hoolamike.yaml when discovery actually changed it
+        if self._config_dirty:
+            self.save_hoolamike_config()
         
         self.logger.info("Hoolamike discovery phase complete.")
 
     def _detect_and_update_game_paths(self):
         """Detect game install paths and update state and config."""
         self.logger.info("Detecting game install paths...")
-        # Always run detection
-        detected_paths = self.path_handler.find_game_install_paths(TARGET_GAME_APPIDS)
-        self.game_install_paths = detected_paths # Update internal state
+        if self.game_install_paths:
+            # Already detected while generating the default config
+            detected_paths = self.game_install_paths
+        else:
+            # Detection result is cached until libraryfolders.vdf changes
+            detected_paths = self._find_target_game_paths()
+            self.game_install_paths = detected_paths # Update internal state
         self.logger.info(f"Detected game paths: {detected_paths}")
 
         # Update the loaded config if it exists
         if self.hoolamike_config is not None:
-            self.logger.debug("Updating loaded hoolamike.yaml with detected game paths.")
-            if "games" not in self.hoolamike_config or not isinstance(self.hoolamike_config.get("games"), dict):
-                self.hoolamike_config["games"] = {} # Ensure games section exists
-            
-            # Define a unified format for game names in config - no spaces
-            # Clear existing entries first to avoid duplicates
-            self.hoolamike_config["games"] = {}
-            
-            # Add detected paths with proper formatting - no spaces
-            for game_name, detected_path in detected_paths.items():
-                formatted_name = self._format_game_name(game_name)
-                self.hoolamike_config["games"][formatted_name] = {"root_directory": str(detected_path)}
-                
-            self.logger.info(f"Updated config with {len(detected_paths)} game paths using correct naming format (no spaces)")
+            # Unified format for game names in config - no spaces
+            new_games = {
+                self._format_game_name(game_name): {"root_directory": str(detected_path)}
+                for game_name, detected_path in detected_paths.items()
+            }
+            if self.hoolamike_config.get("games") == new_games:
+                self.logger.debug("Detected game paths match hoolamike.yaml, no update needed.")
+            else:
+                self.logger.debug("Updating loaded hoolamike.yaml with detected game paths.")
+                self.hoolamike_config["games"] = new_games
+                self._config_dirty = True
+                self.logger.info(f"Updated config with {len(detected_paths)} game paths using correct naming format (no spaces)")
         else:
             self.logger.warning("Cannot update game paths in config because config is not loaded.")
 
@@ -266,6 +399,10 @@ class HoolamikeHandler:
             bool: True if installation/update was successful or process was properly cancelled,
                   False if a critical error occurred.
         """
+        # Only needed for install/update - imported lazily to keep handler startup light
+        import requests
+        import tarfile
+        import zipfile
         self.logger.info("Starting Hoolamike Installation/Update...")
         print("\nStarting Hoolamike Installation/Update...")
         
@@ -308,7 +445,7 @@ class HoolamikeHandler:
                 return True
             # Check if hoolamike already exists at this specific path
             potential_existing_exe = install_dir / HOOLAMIKE_EXECUTABLE_NAME
-            if potential_existing_exe.is_file() and os.access(potential_existing_exe, os.X_OK):
+            if _is_executable_file(potential_existing_exe):
                 self.logger.info(f"Hoolamike executable found at the chosen path: {potential_existing_exe}")
                 print(f"{COLOR_INFO}Hoolamike appears to already be installed at:{COLOR_RESET}")
                 print(f"  {install_dir}")
@@ -324,6 +461,8 @@ class HoolamikeHandler:
                     elif overwrite_choice == '2' or overwrite_choice.lower() == 'q':
                         self.logger.info("User chose to keep existing Hoolamike installation at chosen path.")
                         print("Update cancelled. Using existing installation for this session.")
+                        if install_dir != self.hoolamike_app_install_path:
+                            self._dirs_ensured = False
                         self.hoolamike_app_install_path = install_dir
                         self.hoolamike_executable_path = potential_existing_exe
                         self.hoolamike_installed = True
@@ -332,35 +471,51 @@ class HoolamikeHandler:
                         print(f"{COLOR_WARNING}Invalid choice. Please enter 1 or 2.{COLOR_RESET}")
             # Proceed with install/update
             self.logger.info(f"Proceeding with installation to directory: {install_dir}")
+            if install_dir != self.hoolamike_app_install_path:
+                self._dirs_ensured = False
             self.hoolamike_app_install_path = install_dir
             # Get latest release info from GitHub
             release_url = "https://api.github.com/repos/Niedzwiedzw/hoolamike/releases/latest"
             download_url = None
             asset_name = None
+            expected_sha256 = None
             try:
                 self.logger.info(f"Fetching latest release info from {release_url}")
                 show_status("Fetching latest Hoolamike release info...")
-                response = requests.get(release_url, timeout=15, verify=True)
-                response.raise_for_status()
-                release_data = response.json()
+                # Conditional request: GitHub answers 304 Not Modified if the cached release is still current
+                headers = {"Accept": "application/vnd.github+json"}
+                cached_etag = self.config_handler.get('hoolamike_release_etag')
+                cached_release = self.config_handler.get('hoolamike_release_json')
+                if cached_etag and isinstance(cached_release, dict):
+                    headers["If-None-Match"] = cached_etag
+                response = _get_http_session().get(release_url, headers=headers, timeout=15, verify=True)
+                if response.status_code == 304:
+                    self.logger.info("Latest release unchanged since last check (304), using cached release info.")
+                    release_data = cached_release
+                else:
+                    response.raise_for_status()
+                    release_data = response.json()
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self.config_handler.set('hoolamike_release_etag', etag)
+                        self.config_handler.set('hoolamike_release_json', release_data)
+                        if not self.config_handler.save_config():
+                            self.logger.debug("Could not persist cached Hoolamike release info.")
                 self.logger.debug(f"GitHub Release Data: {release_data}")
-                linux_tar_asset = None
-                linux_zip_asset = None
+                candidates = []
                 for asset in release_data.get('assets', []):
                     name = asset.get('name', '').lower()
                     self.logger.debug(f"Checking asset: {name}")
-                    is_linux = 'linux' in name
-                    is_x64 = 'x86_64' in name or 'amd64' in name
-                    is_incompatible_arch = 'arm' in name or 'aarch64' in name or 'darwin' in name
-                    if is_linux and is_x64 and not is_incompatible_arch:
-                        if name.endswith(('.tar.gz', '.tgz')):
-                            linux_tar_asset = asset
-                            self.logger.debug(f"Found potential tar asset: {name}")
-                            break
-                        elif name.endswith('.zip') and not linux_tar_asset:
-                            linux_zip_asset = asset
-                            self.logger.debug(f"Found potential zip asset: {name}")
-                chosen_asset = linux_tar_asset or linux_zip_asset
+                    m = _ASSET_RE.match(name)
+                    if not m:
+                        continue
+                    priority = _ASSET_KIND_PRIORITY[m.group('kind')]
+                    self.logger.debug(f"Found potential {m.group('kind')} asset: {name}")
+                    if priority == 0:
+                        candidates = [(priority, asset)]
+                        break # Tarball is the preferred format, stop looking
+                    candidates.append((priority, asset))
+                chosen_asset = min(candidates, key=lambda c: c[0])[1] if candidates else None
                 if not chosen_asset:
                     clear_status()
                     self.logger.error("Could not find a suitable Linux x86_64 download asset (tar.gz/zip) in the latest release.")
@@ -368,6 +523,7 @@ class HoolamikeHandler:
                     return False
                 download_url = chosen_asset.get('browser_download_url')
                 asset_name = chosen_asset.get('name')
+                expected_sha256 = _expected_sha256(chosen_asset)
                 if not download_url or not asset_name:
                     clear_status()
                     self.logger.error(f"Chosen asset is missing URL or name: {chosen_asset}")
@@ -385,54 +541,118 @@ class HoolamikeHandler:
                 self.logger.error(f"Error parsing release info: {e}", exc_info=True)
                 print("Error: Failed to understand release information from GitHub.")
                 return False
-            # Download the asset
-            show_status(f"Downloading {asset_name}...")
-            temp_download_path = self.hoolamike_app_install_path / asset_name
-            if not self.filesystem_handler.download_file(download_url, temp_download_path, overwrite=True, quiet=True):
+            is_tar_asset = asset_name.lower().endswith(('.tar.gz', '.tgz'))
+            if is_tar_asset:
+                # Stream the tarball straight into extraction - no temporary archive on disk
+                show_status(f"Downloading and extracting {asset_name}...")
+                # Extract into a staging directory next to the install dir; nothing touches the live
+                # install until the whole asset has been hashed and verified
+                staging_dir = None
+                try:
+                    self.logger.debug(f"Streaming tar extraction from {download_url}")
+                    self.hoolamike_app_install_path.mkdir(parents=True, exist_ok=True)
+                    staging_dir = Path(tempfile.mkdtemp(prefix=".hoolamike-update-", dir=self.hoolamike_app_install_path.parent))
+                    sha256 = hashlib.sha256()
+                    with _get_http_session().get(download_url, stream=True, timeout=300, verify=True) as r:
+                        r.raise_for_status()
+                        r.raw.decode_content = True
+                        reader = _HashingReader(r.raw, sha256)
+                        with tarfile.open(fileobj=reader, mode='r|gz', bufsize=_ARCHIVE_IO_BUFSIZE) as tar:
+                            if hasattr(tarfile, 'data_filter'):
+                                tar.extractall(path=staging_dir, filter='data')
+                            else:
+                                tar.extractall(path=staging_dir)
+                        # Drain any trailing bytes so the digest covers the whole asset
+                        while reader.read(_ARCHIVE_IO_BUFSIZE):
+                            pass
+                    if expected_sha256 and sha256.hexdigest() != expected_sha256:
+                        clear_status()
+                        self.logger.error(f"SHA256 mismatch for {asset_name}: expected {expected_sha256}, got {sha256.hexdigest()}")
+                        print(f"{COLOR_ERROR}Error: Downloaded Hoolamike asset failed integrity verification.{COLOR_RESET}")
+                        return False
+                    # Verified: move the extracted members into the install directory
+                    for entry in staging_dir.iterdir():
+                        dest = self.hoolamike_app_install_path / entry.name
+                        if entry.is_dir() and not entry.is_symlink():
+                            shutil.copytree(entry, dest, symlinks=True, dirs_exist_ok=True)
+                        else:
+                            os.replace(entry, dest)
+                    self.logger.info("Downloaded and extracted tar file successfully.")
+                    clear_status()
+                    print("Extraction complete. Setting permissions...")
+                except requests.exceptions.RequestException as e:
+                    clear_status()
+                    self.logger.error(f"Failed to download {asset_name} from {download_url}: {e}")
+                    print(f"{COLOR_ERROR}Error: Failed to download Hoolamike asset.{COLOR_RESET}")
+                    return False
+                except (tarfile.TarError, EOFError) as e:
+                    clear_status()
+                    self.logger.error(f"Failed to extract archive {asset_name}: {e}", exc_info=True)
+                    print(f"{COLOR_ERROR}Error: Failed to extract downloaded file: {e}{COLOR_RESET}")
+                    return False
+                except Exception as e:
+                    clear_status()
+                    self.logger.error(f"An unexpected error occurred during extraction: {e}", exc_info=True)
+                    print(f"{COLOR_ERROR}An unexpected error occurred during extraction.{COLOR_RESET}")
+                    return False
+                finally:
+                    if staging_dir is not None:
+                        shutil.rmtree(staging_dir, ignore_errors=True)
+            elif asset_name.lower().endswith('.zip'):
+                # Zip needs random access, so download to disk first
+                show_status(f"Downloading {asset_name}...")
+                temp_download_path = self.hoolamike_app_install_path / asset_name
+                sha256 = hashlib.sha256()
+                if not self.filesystem_handler.download_file(download_url, temp_download_path, overwrite=True, quiet=True, hash_obj=sha256, session=_get_http_session()):
+                    clear_status()
+                    self.logger.error(f"Failed to download {asset_name} from {download_url}")
+                    print(f"{COLOR_ERROR}Error: Failed to download Hoolamike asset.{COLOR_RESET}")
+                    return False
+                if expected_sha256 and sha256.hexdigest() != expected_sha256:
+                    clear_status()
+                    self.logger.error(f"SHA256 mismatch for {asset_name}: expected {expected_sha256}, got {sha256.hexdigest()}")
+                    print(f"{COLOR_ERROR}Error: Downloaded Hoolamike asset failed integrity verification.{COLOR_RESET}")
+                    try:
+                        temp_download_path.unlink()
+                    except OSError:
+                        pass
+                    return False
                 clear_status()
-                self.logger.error(f"Failed to download {asset_name} from {download_url}")
-                print(f"{COLOR_ERROR}Error: Failed to download Hoolamike asset.{COLOR_RESET}")
-                return False
-            clear_status()
-            self.logger.info(f"Downloaded {asset_name} successfully to {temp_download_path}")
-            show_status("Extracting Hoolamike archive...")
-            # Extract the asset
-            try:
-                if asset_name.lower().endswith(('.tar.gz', '.tgz')):
-                    self.logger.debug(f"Extracting tar file: {temp_download_path}")
-                    with tarfile.open(temp_download_path, 'r:*') as tar:
-                        tar.extractall(path=self.hoolamike_app_install_path)
-                    self.logger.info("Extracted tar file successfully.")
-                elif asset_name.lower().endswith('.zip'):
+                self.logger.info(f"Downloaded {asset_name} successfully to {temp_download_path}")
+                show_status("Extracting Hoolamike archive...")
+                try:
                     self.logger.debug(f"Extracting zip file: {temp_download_path}")
-                    with zipfile.ZipFile(temp_download_path, 'r') as zip_ref:
-                        zip_ref.extractall(self.hoolamike_app_install_path)
+                    fd = os.open(temp_download_path, os.O_RDONLY)
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    with os.fdopen(fd, 'rb', buffering=_ARCHIVE_IO_BUFSIZE) as archive_file:
+                        with zipfile.ZipFile(archive_file, 'r') as zip_ref:
+                            zip_ref.extractall(self.hoolamike_app_install_path)
                     self.logger.info("Extracted zip file successfully.")
-                else:
                     clear_status()
-                    self.logger.error(f"Unknown archive format for asset: {asset_name}")
-                    print(f"{COLOR_ERROR}Error: Unknown file type '{asset_name}'. Cannot extract.{COLOR_RESET}")
+                    print("Extraction complete. Setting permissions...")
+                except (zipfile.BadZipFile, EOFError) as e:
+                    clear_status()
+                    self.logger.error(f"Failed to extract archive {temp_download_path}: {e}", exc_info=True)
+                    print(f"{COLOR_ERROR}Error: Failed to extract downloaded file: {e}{COLOR_RESET}")
                     return False
-                clear_status()
-                print("Extraction complete. Setting permissions...")
-            except (tarfile.TarError, zipfile.BadZipFile, EOFError) as e:
-                clear_status()
-                self.logger.error(f"Failed to extract archive {temp_download_path}: {e}", exc_info=True)
-                print(f"{COLOR_ERROR}Error: Failed to extract downloaded file: {e}{COLOR_RESET}")
-                return False
-            except Exception as e:
-                clear_status()
-                self.logger.error(f"An unexpected error occurred during extraction: {e}", exc_info=True)
-                print(f"{COLOR_ERROR}An unexpected error occurred during extraction.{COLOR_RESET}")
+                except Exception as e:
+                    clear_status()
+                    self.logger.error(f"An unexpected error occurred during extraction: {e}", exc_info=True)
+                    print(f"{COLOR_ERROR}An unexpected error occurred during extraction.{COLOR_RESET}")
+                    return False
+                finally:
+                    # Clean up downloaded archive
+                    if temp_download_path.exists():
+                        try:
+                            temp_download_path.unlink()
+                            self.logger.debug(f"Removed temporary download file: {temp_download_path}")
+                        except OSError as e:
+                            self.logger.warning(f"Could not remove temporary download file {temp_download_path}: {e}")
+            else:
+                self.logger.error(f"Unknown archive format for asset: {asset_name}")
+                print(f"{COLOR_ERROR}Error: Unknown file type '{asset_name}'. Cannot extract.{COLOR_RESET}")
                 return False
-            finally:
-                # Clean up downloaded archive
-                if temp_download_path.exists():
-                    try:
-                        temp_download_path.unlink()
-                        self.logger.debug(f"Removed temporary download file: {temp_download_path}")
-                    except OSError as e:
-                        self.logger.warning(f"Could not remove temporary download file {temp_download_path}: {e}")
             # Set execute permissions on the binary
             executable_path = self.hoolamike_app_install_path / HOOLAMIKE_EXECUTABLE_NAME
             if executable_path.is_file():
@@ -473,6 +693,40 @@ class HoolamikeHandler:
             print(f"{COLOR_ERROR}Error: An unexpected error occurred during Hoolamike installation/update: {e}{COLOR_RESET}")
             return False
 
+    @staticmethod
+    def _wait_child(proc: subprocess.Popen) -> int:
+        """Wait for a child process to exit.
+
+        On Linux 5.3+ this blocks on a pidfd via a selector (event-driven, no polling);
+        otherwise it falls back to a plain Popen.wait().
+        """
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(proc.pid)
+            except OSError:
+                pidfd = None
+            if pidfd is not None:
+                try:
+                    with selectors.DefaultSelector() as sel:
+                        sel.register(pidfd, selectors.EVENT_READ)
+                        sel.select()
+                finally:
+                    os.close(pidfd)
+        # Reap the child and record its return code on the Popen object
+        return proc.wait()
+
+    def _run_hoolamike(self, cmd: List[str]) -> int:
+        """Run a Hoolamike command in the install directory and return its exit code.
+        On Ctrl+C the child is terminated before the KeyboardInterrupt propagates.
+        """
+        proc = subprocess.Popen(cmd, cwd=str(self.hoolamike_app_install_path), env=get_clean_subprocess_env())
+        try:
+            return self._wait_child(proc)
+        except KeyboardInterrupt:
+            proc.terminate()
+            proc.wait()
+            raise
+
     def install_modlist(self, wabbajack_path=None, install_path=None, downloads_path=None, premium=False, api_key=None, game_resolution=None, context=None):
         """
         Install a Wabbajack modlist using Hoolamike, following Jackify's Discovery/Configuration/Confirmation pattern.
@@ -486,7 +740,7 @@ class HoolamikeHandler:
 
         # --- Discovery Phase ---
         # 1. Auto-detect games (robust, multi-library)
-        detected_games = self.path_handler.find_vanilla_game_paths()
+        detected_games = self._get_detected_games(force=True)
         # 2. Prompt for .wabbajack file (custom prompt, only accept .wabbajack, q to exit, with tab-completion)
         print()
         while not wabbajack_path:
@@ -529,7 +783,7 @@ class HoolamikeHandler:
             else:
                 install_path, install_should_create = install_path_result, False
             # Check if directory exists and is not empty
-            if install_path.exists() and any(install_path.iterdir()):
+            if install_path.exists() and _is_dir_nonempty(install_path):
                 print(f"{COLOR_WARNING}Warning: The selected directory '{install_path}' already exists and is not empty. Its contents may be overwritten!{COLOR_RESET}")
                 confirm = input(f"{COLOR_PROMPT}This directory is not empty and may be overwritten. Proceed? (y/N): {COLOR_RESET}").strip().lower()
                 if not confirm.startswith('y'):
@@ -584,14 +838,14 @@ class HoolamikeHandler:
             print(f"{COLOR_WARNING}Cancelled by user.{COLOR_RESET}")
             return False
         # --- Actually create directories if needed ---
-        if install_should_create and not install_path.exists():
+        if install_should_create: # mkdir(exist_ok=True) alone covers the already-exists case
             try:
                 install_path.mkdir(parents=True, exist_ok=True)
                 print(f"{COLOR_SUCCESS}Install directory created: {install_path}{COLOR_RESET}")
             except Exception as e:
                 print(f"{COLOR_ERROR}Failed to create install directory: {e}{COLOR_RESET}")
                 return False
-        if downloads_should_create and not downloads_path.exists():
+        if downloads_should_create:
             try:
                 downloads_path.mkdir(parents=True, exist_ok=True)
                 print(f"{COLOR_SUCCESS}Downloads directory created: {downloads_path}{COLOR_RESET}")
@@ -636,7 +890,7 @@ class HoolamikeHandler:
             return False
         try:
             cmd = [str(self.hoolamike_executable_path), "install"]
-            ret = subprocess.call(cmd, cwd=str(self.hoolamike_app_install_path), env=get_clean_subprocess_env())
+            ret = self._run_hoolamike(cmd)
             if ret == 0:
                 print(f"\n{COLOR_SUCCESS}Hoolamike completed successfully!{COLOR_RESET}")
                 input(f"{COLOR_PROMPT}Press Enter to return to the Hoolamike menu...{COLOR_RESET}")
@@ -686,7 +940,7 @@ class HoolamikeHandler:
         
         # Verify required games are in configuration
         required_games = ['Fallout 3', 'Fallout New Vegas']
-        detected_games = self.path_handler.find_vanilla_game_paths()
+        detected_games = self._get_detected_games(force=True)
         missing_games = [game for game in required_games if game not in detected_games]
         if missing_games:
             self.logger.error(f"Missing required games for TTW installation: {', '.join(missing_games)}")
@@ -725,7 +979,7 @@ class HoolamikeHandler:
             if not ttw_output_path:
                 print(f"{COLOR_WARNING}Cancelled by user.{COLOR_RESET}")
                 return False
-            if ttw_output_path.exists() and any(ttw_output_path.iterdir()):
+            if ttw_output_path.exists() and _is_dir_nonempty(ttw_output_path):
                 print(f"{COLOR_WARNING}Warning: The selected directory '{ttw_output_path}' already exists and is not empty. Its contents may be overwritten!{COLOR_RESET}")
                 confirm = input(f"{COLOR_PROMPT}This directory is not empty and may be overwritten. Proceed? (y/N): {COLOR_RESET}").strip().lower()
                 if not confirm.startswith('y'):
@@ -749,8 +1003,8 @@ class HoolamikeHandler:
             print(f"{COLOR_WARNING}Cancelled by user.{COLOR_RESET}")
             return False
 
-        # --- Always re-detect games before updating config ---
-        detected_games = self.path_handler.find_vanilla_game_paths()
+        # --- Reuse the games detected at the start of this flow ---
+        detected_games = self._get_detected_games()
         if not detected_games:
             print(f"{COLOR_ERROR}No supported games were detected on your system. TTW requires Fallout 3 and Fallout New Vegas to be installed.{COLOR_RESET}")
             return False
@@ -779,7 +1033,7 @@ class HoolamikeHandler:
         print(f"Command: {' '.join(cmd)}")
         print(f"{COLOR_INFO}Streaming output below. Press Ctrl+C to cancel and return to Jackify menu.{COLOR_RESET}\n")
         try:
-            ret = subprocess.call(cmd, cwd=str(self.hoolamike_app_install_path), env=get_clean_subprocess_env())
+            ret = self._run_hoolamike(cmd)
             if ret == 0:
                 self.logger.info("TTW installation completed successfully.")
                 print(f"\n{COLOR_SUCCESS}TTW installation completed successfully!{COLOR_RESET}")
@@ -798,44 +1052,22 @@ class HoolamikeHandler:
 
     def _update_hoolamike_config_for_ttw(self, ttw_mpi_path: Path, ttw_output_path: Path):
         """Update the Hoolamike configuration with settings for TTW installation."""
-        # Ensure extras and TTW sections exist
-        if "extras" not in self.hoolamike_config:
-            self.hoolamike_config["extras"] = {}
-            
-        if "tale_of_two_wastelands" not in self.hoolamike_config["extras"]:
-            self.hoolamike_config["extras"]["tale_of_two_wastelands"] = {
-                "variables": {}
-            }
-            
+        # Ensure extras, TTW and variables sections exist
+        ttw_config = self.hoolamike_config.setdefault("extras", {}).setdefault("tale_of_two_wastelands", {})
+        variables = ttw_config.setdefault("variables", {})
+
         # Update TTW configuration
-        ttw_config = self.hoolamike_config["extras"]["tale_of_two_wastelands"]
         ttw_config["path_to_ttw_mpi_file"] = str(ttw_mpi_path)
-        
-        # Ensure variables section exists
-        if "variables" not in ttw_config:
-            ttw_config["variables"] = {}
-            
         # Set destination variable
-        ttw_config["variables"]["DESTINATION"] = str(ttw_output_path)
-        
+        variables["DESTINATION"] = str(ttw_output_path)
         # Set USERPROFILE to a Jackify-managed directory for TTW
-        userprofile_path = str(self.hoolamike_app_install_path / "USERPROFILE")
-        if "variables" not in self.hoolamike_config["extras"]["tale_of_two_wastelands"]:
-            self.hoolamike_config["extras"]["tale_of_two_wastelands"]["variables"] = {}
-        self.hoolamike_config["extras"]["tale_of_two_wastelands"]["variables"]["USERPROFILE"] = userprofile_path
+        variables["USERPROFILE"] = str(self.hoolamike_app_install_path / "USERPROFILE")
         
-        # Make sure game paths are set correctly
+        # Make sure game paths are set correctly (same no-space keys as the rest of the games section)
+        games = self.hoolamike_config.setdefault("games", {})
         for game in ['Fallout 3', 'Fallout New Vegas']:
             if game in self.game_install_paths:
-                game_key = game.replace(' ', '').lower()
-                
-                if "games" not in self.hoolamike_config:
-                    self.hoolamike_config["games"] = {}
-                    
-                if game not in self.hoolamike_config["games"]:
-                    self.hoolamike_config["games"][game] = {}
-                    
-                self.hoolamike_config["games"][game]["root_directory"] = str(self.game_install_paths[game])
+                games[self._format_game_name(game)] = {"root_directory": str(self.game_install_paths[game])}
                 
         self.logger.info("Updated Hoolamike configuration with TTW settings.")
 
@@ -843,12 +1075,15 @@ class HoolamikeHandler:
         """Resets the hoolamike.yaml to default settings, backing up any existing file."""
         if self.hoolamike_config_path.is_file():
             # Create a backup with timestamp
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.hoolamike_config_path.with_suffix(f".{timestamp}.bak")
             try:
-                import shutil
-                shutil.copy2(self.hoolamike_config_path, backup_path)
+                # Hardlink is zero-copy; the save below replaces hoolamike.yaml with a new inode,
+                # so the backup keeps the old contents. Fall back to copying (e.g. no hardlink support).
+                try:
+                    os.link(self.hoolamike_config_path, backup_path)
+                except OSError:
+                    shutil.copy2(self.hoolamike_config_path, backup_path)
                 self.logger.info(f"Created backup of existing config at {backup_path}")
                 print(f"{COLOR_INFO}Created backup of existing config at {backup_path}{COLOR_RESET}")
             except Exception as e:
@@ -867,6 +1102,30 @@ class HoolamikeHandler:
             print(f"{COLOR_ERROR}Failed to save new default configuration.{COLOR_RESET}")
             return False
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _which(name: str) -> Optional[str]:
+        """Cached shutil.which - PATH lookups don't change during a Jackify session."""
+        return shutil.which(name)
+
+    def _find_editors(self, preferred_editor: Optional[str]) -> Dict[str, str]:
+        """Map editor display names to executable paths, detecting them only on first use."""
+        if self._editor_cache is not None:
+            return self._editor_cache
+        found_editors = {}
+        for editor_name in _AVAILABLE_EDITORS:
+            editor_path = self._which(editor_name)
+            if editor_path and editor_path not in found_editors.values():
+                found_editors[editor_name] = editor_path
+        if preferred_editor:
+            preferred_editor_path = self._which(preferred_editor)
+            if preferred_editor_path and preferred_editor_path not in found_editors.values():
+                display_name = os.path.basename(preferred_editor) if '/' in preferred_editor else preferred_editor
+                if display_name not in found_editors:
+                    found_editors[display_name] = preferred_editor_path
+        self._editor_cache = found_editors
+        return found_editors
+
     def edit_hoolamike_config(self):
         """Opens the hoolamike.yaml file in a chosen editor, with a 0 option to return to menu."""
         self.logger.info("Task: Edit Hoolamike Config started...")
@@ -909,20 +1168,8 @@ class HoolamikeHandler:
                  self.logger.error("Failed to create config file for editing.")
                  print("Error: Could not create configuration file.")
                  return
-        available_editors = ["nano", "vim", "vi", "gedit", "kate", "micro"]
         preferred_editor = os.environ.get("EDITOR")
-        found_editors = {}
-        import shutil
-        for editor_name in available_editors:
-            editor_path = shutil.which(editor_name)
-            if editor_path and editor_path not in found_editors.values():
-                found_editors[editor_name] = editor_path
-        if preferred_editor:
-            preferred_editor_path = shutil.which(preferred_editor)
-            if preferred_editor_path and preferred_editor_path not in found_editors.values():
-                display_name = os.path.basename(preferred_editor) if '/' in preferred_editor else preferred_editor
-                if display_name not in found_editors:
-                    found_editors[display_name] = preferred_editor_path
+        found_editors = self._find_editors(preferred_editor)
         if not found_editors:
             self.logger.error("No suitable text editors found on the system.")
             print(f"{COLOR_ERROR}Error: No common text editors (nano, vim, gedit, kate, micro) found.{COLOR_RESET}")
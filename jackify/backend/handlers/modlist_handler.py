@@ -1,20 +1,22 @@
 from pathlib import Path
 import json
+import hashlib
+import functools
 import logging
+import mmap
 from typing import Union, Dict, Optional, List, Tuple
 import re
+import string
 import time
-import vdf
 import os
-import subprocess
-import shutil
-import requests
+import stat
 import atexit
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our modules
-from .path_handler import PathHandler
+from .path_handler import PathHandler, STOCK_GAME_FOLDERS
 # from .wine_utils import WineUtils  # Removed unused import
 from .filesystem_handler import FileSystemHandler
 from .protontricks_handler import ProtontricksHandler
@@ -33,32 +35,199 @@ import logging
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# On-disk cache of discover_executable_shortcuts results, keyed by shortcuts.vdf mtime
+SHORTCUT_DISCOVERY_CACHE_DIR = Path.home() / ".cache" / "jackify" / "shortcuts_correlation"
+
+# Use orjson for modlists.json when installed (optional), otherwise the stdlib parser; both accept bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Script extender loaders that identify a modlist's game (single pass over raw ModOrganizer.ini bytes)
+_LOADER_RE = re.compile(rb'(skse64|f4se|nvse|obse)_loader\.exe', re.IGNORECASE)
+# Start of the CompatToolMapping section in Steam's config.vdf
+_COMPAT_TOOL_MAPPING_RE = re.compile(rb'"CompatToolMapping"\s*\{')
+_VDF_BRACE_RE = re.compile(rb'[{}]')
+# Proton runtime version recorded in a prefix's system.reg
+_PROTON_VER_RE = re.compile(rb'"SteamClientProtonVersion"="([^"]+)"')
+# Removable media mount points (SD card on Steam Deck)
+_SDCARD_RE = re.compile(r'^/(run/media|media)(/|$)')
+# WIDTHxHEIGHT resolution entered at the interactive prompt
+_RESOLUTION_RE = re.compile(r'\A[0-9]+x[0-9]+\Z')
+# Stock game folder names inside a modlist (lowercase) -> preference rank, lowest first
+_STOCK_GAME_NAMES = {
+    "stock game": 0,
+    "game root": 1,
+    "stock game folder": 2,
+    "stock folder": 3,
+    "skyrim stock": 4,
+}
+# ModOrganizer.ini markers for special games: group 1 = FNV, group 2 = Enderal-specific names
+_MO2_MARKERS_RE = re.compile(rb'(nvse|fallout new vegas|falloutnv)|(enderal launcher|enderal\.exe|enderalsteam)', re.IGNORECASE)
+# Game keywords (lowercase, spaces removed) that select the extra Wine components; D3D11-era games win
+_D3D11_GAME_RE = re.compile(r'skyrim|fallout4|starfield|oblivion_remastered|enderal')
+_D3D9_GAME_RE = re.compile(r'falloutnewvegas|fnv|oblivion')
+# Lowercases (ASCII) and strips separators from modlist names in one pass, before matching them against component keys
+_MODLIST_NAME_NORM_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, ' \t-_')
+# Lowercases (ASCII) and strips spaces from game names in one pass
+_GAME_NAME_NORM_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, ' ')
+
+def _find_compat_tool_mapping_section(content: bytes) -> Optional[bytes]:
+    """Return the body of config.vdf's CompatToolMapping section, or None if it can't be located."""
+    start_match = _COMPAT_TOOL_MAPPING_RE.search(content)
+    if not start_match:
+        return None
+    depth = 1
+    for brace in _VDF_BRACE_RE.finditer(content, start_match.end()):
+        depth += 1 if brace.group() == b'{' else -1
+        if depth == 0:
+            return content[start_match.end():brace.start()]
+    return None
+
+# Compiled per-AppID CompatToolMapping entry patterns
+_COMPAT_RE_CACHE: Dict[str, "re.Pattern"] = {}
+
+def _compat_tool_name_from_section(section: bytes, appid: str) -> str:
+    """Extract the 'name' value of an AppID's entry within a CompatToolMapping section body."""
+    pattern = _COMPAT_RE_CACHE.get(appid)
+    if pattern is None:
+        pattern = re.compile(rb'"' + re.escape(appid.encode()) + rb'"\s*\{[^}]*?"name"\s*"([^"]*)"')
+        _COMPAT_RE_CACHE[appid] = pattern
+    match = pattern.search(section)
+    return match.group(1).decode('utf-8', 'ignore') if match else ''
+
+@functools.lru_cache(maxsize=128)
+def _compute_wine_components(modlist_name: str, game_var_full: str,
+                             modlist_components_norm: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Tuple[str, ...]:
+    """Memoized body of ModlistHandler.get_modlist_wine_components (pure in its arguments)."""
+    default_components = ["fontsmooth=rgb", "xact", "xact_x64", "vcrun2022"]
+    extras = []
+    # Determine game type
+    game = (game_var_full or modlist_name).translate(_GAME_NAME_NORM_TABLE)
+    # Add game-specific extras
+    if _D3D11_GAME_RE.search(game):
+        extras += ["d3dcompiler_47", "d3dx11_43", "d3dcompiler_43", "dotnet6", "dotnet7"]
+    elif _D3D9_GAME_RE.search(game):
+        extras += ["d3dx9_43", "d3dx9"]
+    # Add modlist-specific extras
+    modlist_norm = modlist_name.translate(_MODLIST_NAME_NORM_TABLE)
+    for key, components in modlist_components_norm:
+        if key in modlist_norm:
+            extras += components
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(default_components + extras))
+
+# systemd user unit that runs Steam in the Steam Deck desktop session
+_STEAM_AUTOSTART_UNIT = "app-steam@autostart.service"
+
+def _read_dmi_product_name() -> bytes:
+    """Raw DMI product name (b'Jupiter' / b'Galileo' on Steam Deck hardware), or b'' if unavailable."""
+    try:
+        with open('/sys/devices/virtual/dmi/id/product_name', 'rb') as f:
+            return f.read(256)
+    except OSError:
+        return b''
+
+@functools.lru_cache(maxsize=1)
+def _detect_steam_deck() -> bool:
+    """Steam Deck check, done once per process (the answer cannot change while running)."""
+    try:
+        if os.path.exists('/etc/os-release'):
+            # os-release is tiny; one raw read, searched as bytes
+            fd = os.open('/etc/os-release', os.O_RDONLY)
+            try:
+                data = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            if b'steamdeck' in data.lower():
+                return True
+    except Exception as e:
+        logger.warning(f"Error detecting Steam Deck: {e}")
+    # Steam Deck hardware identifies itself through DMI regardless of the installed OS
+    if _read_dmi_product_name().startswith((b'Jupiter', b'Galileo')):
+        return True
+    # Otherwise look for the app-steam@autostart.service unit on disk rather than
+    # asking systemctl; the XDG autostart generator writes it under the user's runtime directory
+    try:
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or f"/run/user/{os.getuid()}"
+        unit_paths = (
+            os.path.join(runtime_dir, "systemd", "generator.late", _STEAM_AUTOSTART_UNIT),
+            os.path.expanduser(os.path.join("~", ".config", "systemd", "user", _STEAM_AUTOSTART_UNIT)),
+            os.path.join("/etc/systemd/user", _STEAM_AUTOSTART_UNIT),
+            os.path.join("/usr/lib/systemd/user", _STEAM_AUTOSTART_UNIT),
+        )
+        if any(os.path.exists(path) for path in unit_paths):
+            return True
+    except Exception as e:
+        logger.warning(f"Error detecting Steam Deck: {e}")
+    return False
+
+class _LazyJson:
+    """Log argument that is only serialized to indented JSON if the record is actually emitted."""
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __str__(self):
+        return json.dumps(self._obj, indent=2)
+
+# Terminal attributes captured at import, restored directly via termios (no stty subprocess)
+_SAVED_TERMIOS = None
+try:
+    import termios
+    # Skip in GUI mode / without a tty to prevent "Inappropriate ioctl for device" errors
+    if os.environ.get('JACKIFY_GUI_MODE') != '1' and sys.stdin is not None and sys.stdin.isatty():
+        _SAVED_TERMIOS = termios.tcgetattr(sys.stdin.fileno())
+except Exception:
+    _SAVED_TERMIOS = None
+
 # Ensure terminal state is restored on exit, error, or interrupt
 def _restore_terminal():
+    if _SAVED_TERMIOS is None:
+        return
     try:
-        # Skip stty in GUI mode to prevent "Inappropriate ioctl for device" error
-        if os.environ.get('JACKIFY_GUI_MODE') == '1':
-            return
-        os.system('stty sane')
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, _SAVED_TERMIOS)
     except Exception:
         pass
 
-# Only register signal handlers if we're in the main thread
-try:
-    import threading
-    if threading.current_thread() is threading.main_thread():
-        atexit.register(_restore_terminal)
-        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
-            signal.signal(sig, lambda signum, frame: (_restore_terminal(), sys.exit(1)))
-except Exception:
-    # If signal handling fails, just continue without it
-    pass
+_SIGNALS_INSTALLED = False
+
+def install_signal_handlers():
+    """Register the terminal-restore atexit hook and signal handlers (CLI entry point only, once)."""
+    global _SIGNALS_INSTALLED
+    if _SIGNALS_INSTALLED:
+        return
+    # Only register signal handlers if we're in the main thread
+    try:
+        import threading
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_restore_terminal)
+            for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+                signal.signal(sig, lambda signum, frame: (_restore_terminal(), sys.exit(1)))
+            _SIGNALS_INSTALLED = True
+    except Exception:
+        # If signal handling fails, just continue without it
+        pass
 
 class ModlistHandler:
     """
     Handles operations related to modlist detection and configuration
     """
+
+    # config.vdf CompatToolMapping sections keyed by path -> (mtime_ns, section body), shared across instances
+    _compat_mapping_cache: Dict[str, Tuple[int, Optional[bytes]]] = {}
     
+    # Script extender loader (as matched by _LOADER_RE, lowercased) -> (full game name, short game name)
+    _LOADER_TO_GAME = {
+        b"skse64_loader.exe": ("Skyrim Special Edition", "Skyrim"),
+        b"f4se_loader.exe": ("Fallout 4", "Fallout"),
+        b"nvse_loader.exe": ("Fallout New Vegas", "FNV"),
+        b"obse_loader.exe": ("Oblivion", "Oblivion"),
+    }
+
     # Dictionary mapping modlist name patterns (lowercase, spaces optional) 
     # to lists of additional Wine components or special actions.
     MODLIST_SPECIFIC_COMPONENTS = {
@@ -82,6 +251,12 @@ class ModlistHandler:
         "lorerim": ["dotnet40"],
         "lostlegacy": ["dotnet48"],
     }
+    # MODLIST_WINE_COMPONENTS with keys normalized once (interned), for matching normalized modlist names;
+    # fully immutable so it can be part of the _compute_wine_components cache key
+    _MODLIST_WINE_COMPONENTS_NORM = tuple(
+        (sys.intern(key.translate(_MODLIST_NAME_NORM_TABLE)), tuple(components))
+        for key, components in MODLIST_WINE_COMPONENTS.items()
+    )
     
     def __init__(self, steam_path_or_config: Union[Dict, str, Path, None] = None, 
                  mo2_path: Optional[Union[str, Path]] = None, 
@@ -104,7 +279,6 @@ class ModlistHandler:
         """
         # Use standard logging (no file handler)
         self.logger = logging.getLogger(__name__)
-        self.logger.propagate = False
         self.steamdeck = steamdeck
         self.steam_path: Optional[Path] = None
         self.verbose = verbose # Store verbose flag
@@ -157,6 +331,21 @@ class ModlistHandler:
         self.which_protontricks = None 
         self.steamdeck = steamdeck
         self.stock_game_path = None
+        # Per-AppID detection results, reused across summary/configuration steps
+        self._proton_ver_cache: Dict[str, str] = {}
+        self._compatdata_cache: Dict[str, Path] = {}
+        # stat() results for paths already validated in this modlist context (only existing paths)
+        self._path_stat_cache: Dict[str, os.stat_result] = {}
+        # Pooled HTTP session for configuration downloads (created on first use)
+        self._http = None
+        # Background pool for downloads overlapped with other configuration steps
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # config.vdf location found by verify_proton_setup
+        self._config_vdf_path: Optional[Path] = None
+        # detect_special_game_type result for the current configuration run
+        self._special_game_type: Optional[str] = None
+        # detect_special_game_type results per (modlist_dir, game_var), valid while the dir's mtime is unchanged
+        self._special_type_cache: Dict[Tuple[str, Optional[str]], Tuple[int, Optional[str]]] = {}
         
         # Initialize Handlers (should happen regardless of how paths were provided)
         self.protontricks_handler = ProtontricksHandler(self.steamdeck, logger=self.logger)
@@ -184,6 +373,54 @@ class ModlistHandler:
         from jackify.shared.timing import get_timestamp
         return get_timestamp()
     
+    def _stat_cached(self, path: Union[str, Path]) -> Optional[os.stat_result]:
+        """os.stat() that reuses results for paths already seen in this modlist context."""
+        key = os.fspath(path)
+        st = self._path_stat_cache.get(key)
+        if st is None:
+            try:
+                st = os.stat(key)
+            except OSError:
+                return None
+            self._path_stat_cache[key] = st
+        return st
+
+    @staticmethod
+    def _wait_file_settled(path: Union[str, Path], timeout: float = 2.0, interval: float = 0.1) -> Optional[int]:
+        """Wait until path's mtime is unchanged for one interval or timeout elapses; returns the last mtime_ns seen."""
+        deadline = time.monotonic() + timeout
+        try:
+            last = os.stat(path).st_mtime_ns
+        except OSError:
+            last = None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return last
+            time.sleep(min(interval, remaining))
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = None
+            if current == last:
+                return current
+            last = current
+
+    def _find_compat_data_cached(self, appid: str) -> Optional[Path]:
+        """find_compat_data with per-AppID memoization.
+
+        Only found paths are cached: a missing prefix may appear once the user
+        launches the shortcut from Steam, so misses are always re-checked.
+        """
+        appid = str(appid)
+        cached = self._compatdata_cache.get(appid)
+        if cached is not None:
+            return cached
+        compat_path = self.path_handler.find_compat_data(appid)
+        if compat_path:
+            self._compatdata_cache[appid] = compat_path
+        return compat_path
+
     # --- Original methods continue below --- 
     def _load_modlists(self) -> None:
         """Load modlists from local configuration or detect from Steam shortcuts."""
@@ -196,8 +433,9 @@ class ModlistHandler:
                  
             config_path = self.steam_path.parent / 'modlists.json'
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    self.modlists = json.load(f)
+                # Single unbuffered read of the raw bytes, no text-decoding layer
+                with open(config_path, 'rb', buffering=0) as f:
+                    self.modlists = _json_loads(f.read())
                 self.logger.info("Loaded modlists from local configuration")
                 return
             
@@ -225,44 +463,39 @@ class ModlistHandler:
             Returns an empty list if none are found or an error occurs.
         """
         self.logger.info(f"Discovering non-Steam shortcuts for executable: {executable_name}")
+        cache_file = self._discovery_cache_file(executable_name)
+        cached_info = self._read_discovery_cache(cache_file)
+        if cached_info is not None:
+            self.logger.info(f"Using cached shortcut discovery ({len(cached_info)} shortcuts) for {executable_name}")
+            return cached_info
         discovered_modlists_info = [] 
 
         try:
             # Get shortcuts pointing to the executable from shortcuts.vdf
             matching_vdf_shortcuts = self.shortcut_handler.find_shortcuts_by_exe(executable_name)
             if not matching_vdf_shortcuts:
-                self.logger.debug(f"No shortcuts found pointing to '{executable_name}' in shortcuts.vdf.")
+                self.logger.debug("No shortcuts found pointing to '%s' in shortcuts.vdf.", executable_name)
                 return []
-            self.logger.debug(f"Shortcuts matching executable '{executable_name}' in VDF: {matching_vdf_shortcuts}")
-
-            # Process each matching shortcut and convert signed AppID to unsigned
-            for vdf_shortcut in matching_vdf_shortcuts:
-                app_name = vdf_shortcut.get('AppName')
-                start_dir = vdf_shortcut.get('StartDir')
-                signed_appid = vdf_shortcut.get('appid')
-
-                if not app_name or not start_dir:
-                    self.logger.warning(f"Skipping VDF shortcut due to missing AppName or StartDir: {vdf_shortcut}")
-                    continue
-
-                if signed_appid is None:
-                    self.logger.warning(f"Skipping VDF shortcut due to missing appid: {vdf_shortcut}")
-                    continue
+            self.logger.debug("Shortcuts matching executable '%s' in VDF: %s", executable_name, matching_vdf_shortcuts)
+
+            # Keep shortcuts with AppName, StartDir and appid; convert signed AppID to unsigned
+            # (the format used by Steam prefixes)
+            discovered_modlists_info = [
+                {'name': app_name, 'appid': signed_appid & 0xFFFFFFFF, 'path': start_dir}
+                for vdf_shortcut in matching_vdf_shortcuts
+                if (app_name := vdf_shortcut.get('AppName'))
+                and (start_dir := vdf_shortcut.get('StartDir'))
+                and (signed_appid := vdf_shortcut.get('appid')) is not None
+            ]
 
-                # Convert signed AppID to unsigned AppID (the format used by Steam prefixes)
-                if signed_appid < 0:
-                    unsigned_appid = signed_appid + (2**32)
-                else:
-                    unsigned_appid = signed_appid
+            if len(discovered_modlists_info) != len(matching_vdf_shortcuts):
+                for vdf_shortcut in matching_vdf_shortcuts:
+                    if not vdf_shortcut.get('AppName') or not vdf_shortcut.get('StartDir') or vdf_shortcut.get('appid') is None:
+                        self.logger.warning(f"Skipping VDF shortcut due to missing AppName, StartDir or appid: {vdf_shortcut}")
 
-                # Append dictionary with all necessary info using unsigned AppID
-                modlist_info = {
-                    'name': app_name,
-                    'appid': unsigned_appid,
-                    'path': start_dir
-                }
-                discovered_modlists_info.append(modlist_info)
-                self.logger.info(f"Discovered shortcut: '{app_name}' (Signed: {signed_appid} → Unsigned: {unsigned_appid}, Path: {start_dir})")
+            if self.logger.isEnabledFor(logging.INFO):
+                for modlist_info in discovered_modlists_info:
+                    self.logger.info(f"Discovered shortcut: '{modlist_info['name']}' (AppID: {modlist_info['appid']}, Path: {modlist_info['path']})")
 
         except Exception as e:
             self.logger.error(f"Error discovering executable shortcuts: {e}", exc_info=True)
@@ -271,8 +504,55 @@ class ModlistHandler:
         if not discovered_modlists_info:
              self.logger.warning("No validated shortcuts found after correlation.")
         
+        self._write_discovery_cache(cache_file, discovered_modlists_info)
         return discovered_modlists_info 
 
+    def _discovery_cache_file(self, executable_name: str) -> Optional[Path]:
+        """Cache file for a discovery result; the key changes whenever shortcuts.vdf is modified."""
+        shortcuts_vdf = getattr(self.shortcut_handler, 'shortcuts_path', None)
+        if not shortcuts_vdf:
+            return None
+        try:
+            mtime_ns = os.stat(shortcuts_vdf).st_mtime_ns
+        except OSError:
+            return None
+        key = hashlib.blake2b(f"{shortcuts_vdf}:{mtime_ns}:{executable_name}".encode(), digest_size=16).hexdigest()
+        return SHORTCUT_DISCOVERY_CACHE_DIR / f"{key}.json"
+
+    def _read_discovery_cache(self, cache_file: Optional[Path]) -> Optional[List[Dict]]:
+        if not cache_file:
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = _json_loads(f.read())
+            return cached if isinstance(cached, list) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug("Ignoring unreadable shortcut discovery cache %s: %s", cache_file, e)
+            return None
+
+    def _write_discovery_cache(self, cache_file: Optional[Path], discovered: List[Dict]) -> None:
+        if not cache_file:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(discovered, f)
+            os.replace(tmp_path, cache_file)
+        except Exception as e:
+            self.logger.debug("Could not write shortcut discovery cache %s: %s", cache_file, e)
+
+    def invalidate_discovery_cache(self) -> None:
+        """Drop all cached shortcut discovery results (forces a fresh shortcuts.vdf scan)."""
+        try:
+            for cache_file in SHORTCUT_DISCOVERY_CACHE_DIR.glob("*.json"):
+                cache_file.unlink()
+            self.logger.info("Shortcut discovery cache cleared.")
+        except OSError as e:
+            self.logger.warning(f"Failed to clear shortcut discovery cache: {e}")
+
     def set_modlist(self, modlist_info: Dict) -> bool:
         """Sets the internal context based on the selected modlist dictionary.
 
@@ -297,43 +577,51 @@ class ModlistHandler:
             self.logger.error(f"Incomplete modlist info provided: {modlist_info}")
             return False
             
-        self.logger.debug(f"Using AppName: {app_name}, AppID: {app_id}, Path: {modlist_dir_path_str}")
+        self.logger.debug("Using AppName: %s, AppID: %s, Path: %s", app_name, app_id, modlist_dir_path_str)
         modlist_dir_path = Path(modlist_dir_path_str)
 
-        # 2. Validate paths and set internal state
-        if not modlist_dir_path.is_dir():
+        # 2. Validate paths and set internal state (one stat() each, kept for later checks)
+        self._path_stat_cache.clear()
+        dir_st = self._stat_cached(modlist_dir_path)
+        if dir_st is None or not stat.S_ISDIR(dir_st.st_mode):
             self.logger.error(f"Modlist directory does not exist: {modlist_dir_path}")
             return False
             
         modlist_ini_path = modlist_dir_path / "ModOrganizer.ini"
-        if not modlist_ini_path.is_file():
+        ini_st = self._stat_cached(modlist_ini_path)
+        if ini_st is None or not stat.S_ISREG(ini_st.st_mode):
              self.logger.error(f"ModOrganizer.ini not found in directory: {modlist_dir_path}")
              return False
 
         # Set state variables
         self.game_name = app_name 
-        self.appid = str(app_id)  # Ensure AppID is always stored as string
-        self.modlist_dir = Path(modlist_dir_path_str) 
+        app_id = str(app_id)  # Ensure AppID is always stored as string
+        if app_id != self.appid:
+            # Different modlist - drop detection results cached for the previous AppID
+            self._proton_ver_cache.clear()
+            self._compatdata_cache.clear()
+            self.proton_ver = None
+        self.appid = app_id
+        self.modlist_dir = modlist_dir_path
         self.modlist_ini = modlist_ini_path 
         
         # Determine if modlist is on SD card (Steam Deck only)
         # On non-Steam Deck systems, /media mounts should use Z: drive, not D: drive
-        if (str(self.modlist_dir).startswith("/run/media") or str(self.modlist_dir).startswith("/media")) and self.steamdeck:
+        on_media_mount = _SDCARD_RE.match(os.fspath(modlist_dir_path)) is not None
+        if on_media_mount and self.steamdeck:
              self.modlist_sdcard = True
              self.logger.info("Modlist appears to be on an SD card (Steam Deck).")
         else:
              self.modlist_sdcard = False
-             if (str(self.modlist_dir).startswith("/run/media") or str(self.modlist_dir).startswith("/media")) and not self.steamdeck:
+             if on_media_mount and not self.steamdeck:
                  self.logger.info("Modlist on /media mount detected on non-Steam Deck system - using Z: drive mapping.")
 
         # Find and set compatdata path now that we have appid
         # Ensure PathHandler is available (should be initialized in __init__)
         if hasattr(self, 'path_handler'):
-             # Convert appid to string since find_compat_data expects a string
-             appid_str = str(self.appid)
-             self.compat_data_path = self.path_handler.find_compat_data(appid_str)
+             self.compat_data_path = self._find_compat_data_cached(self.appid)
              if self.compat_data_path:
-                  self.logger.debug(f"Found compatdata path: {self.compat_data_path}")
+                  self.logger.debug("Found compatdata path: %s", self.compat_data_path)
              else:
                   self.logger.warning(f"Could not find compatdata path for AppID {self.appid}")
         else:
@@ -341,13 +629,13 @@ class ModlistHandler:
              self.compat_data_path = None # Ensure it's None if handler missing
 
         self.logger.info(f"Modlist context set successfully for '{self.game_name}' (AppID: {self.appid})")
-        self.logger.debug(f"  Directory: {self.modlist_dir}")
-        self.logger.debug(f"  INI Path: {self.modlist_ini}")
-        self.logger.debug(f"  On SD Card: {self.modlist_sdcard}")
+        self.logger.debug("  Directory: %s", self.modlist_dir)
+        self.logger.debug("  INI Path: %s", self.modlist_ini)
+        self.logger.debug("  On SD Card: %s", self.modlist_sdcard)
         
         # Store engine_installed flag for conditional path manipulation
         self.engine_installed = modlist_info.get('engine_installed', False)
-        self.logger.debug(f"  Engine Installed: {self.engine_installed}")
+        self.logger.debug("  Engine Installed: %s", self.engine_installed)
 
 
         # Call internal detection methods to populate more state
@@ -364,51 +652,32 @@ class ModlistHandler:
 
     def _detect_game_variables(self):
         """Detect game_var and game_var_full based on ModOrganizer.ini content."""
-        if not self.modlist_ini or not Path(self.modlist_ini).is_file():
+        ini_st = self._stat_cached(self.modlist_ini) if self.modlist_ini else None
+        if ini_st is None or not stat.S_ISREG(ini_st.st_mode):
             self.logger.error("Cannot detect game variables: ModOrganizer.ini path not set or file not found.")
             self.game_var = "Unknown"
             self.game_var_full = "Unknown"
             return False
 
-        # Define mapping from loader executable to full game name
-        loader_to_game = {
-            "skse64_loader.exe": "Skyrim Special Edition",
-            "f4se_loader.exe": "Fallout 4",
-            "nvse_loader.exe": "Fallout New Vegas",
-            "obse_loader.exe": "Oblivion"
-            # Add others if needed
-        }
-        
-        # Short name lookup (can derive from full name later)
-        short_name_lookup = {
-            "Skyrim Special Edition": "Skyrim",
-            "Fallout 4": "Fallout",
-            "Fallout New Vegas": "FNV", # Or "Fallout"
-            "Oblivion": "Oblivion"
-        }
-
+        found_game = None
         try:
-            with open(self.modlist_ini, 'r', encoding='utf-8', errors='ignore') as f:
-                ini_content = f.read().lower() # Read entire file, lowercase for easier matching
+            # Stream the INI in binary and stop at the first loader reference (usually near the top)
+            with open(self.modlist_ini, 'rb', buffering=1 << 20) as f:
+                for line in f:
+                    match = _LOADER_RE.search(line)
+                    if match:
+                        loader = match.group(0).lower()
+                        found_game = self._LOADER_TO_GAME[loader]
+                        self.logger.info(f"Detected game type '{found_game[0]}' based on finding '{loader.decode('ascii')}' in ModOrganizer.ini")
+                        break
         except Exception as e:
             self.logger.error(f"Error reading ModOrganizer.ini ({self.modlist_ini}): {e}")
             self.game_var = "Unknown"
             self.game_var_full = "Unknown"
             return False
-
-        found_game = None
-        for loader, game_name in loader_to_game.items():
-            # Look for the loader name within the INI content
-            # A simple check might be enough, or use regex for more specific context 
-            # (e.g., in a binary= line)
-            if loader in ini_content:
-                found_game = game_name
-                self.logger.info(f"Detected game type '{found_game}' based on finding '{loader}' in ModOrganizer.ini")
-                break
         
         if found_game:
-            self.game_var_full = found_game
-            self.game_var = short_name_lookup.get(found_game, found_game.split()[0]) # Fallback short name
+            self.game_var_full, self.game_var = found_game
             return True
         else:
             # Fallback: Could try checking self.game_name keywords as a last resort?
@@ -418,8 +687,25 @@ class ModlistHandler:
             self.game_var_full = "Unknown"
             return False # Indicate detection failed
 
+    @classmethod
+    def _get_compat_mapping_section(cls, config_vdf_path: Path) -> Optional[bytes]:
+        """Return config.vdf's CompatToolMapping section body, re-reading only when the file's mtime changes."""
+        key = str(config_vdf_path)
+        mtime_ns = os.stat(config_vdf_path).st_mtime_ns
+        cached = cls._compat_mapping_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        with open(config_vdf_path, 'rb') as f:
+            section = _find_compat_tool_mapping_section(f.read())
+        cls._compat_mapping_cache[key] = (mtime_ns, section)
+        return section
+
     def _detect_proton_version(self):
         """Detect the Proton version used for the modlist prefix."""
+        if self.proton_ver and self.proton_ver != "Unknown":
+            self.logger.debug("Proton version already detected: %s", self.proton_ver)
+            return True
+
         self.logger.info(f"Detecting Proton version for AppID {self.appid}...")
         self.proton_ver = "Unknown"
 
@@ -427,28 +713,39 @@ class ModlistHandler:
             self.logger.error("Cannot detect Proton version without a valid AppID.")
             return False
 
+        cached_ver = self._proton_ver_cache.get(self.appid)
+        if cached_ver:
+            self.proton_ver = cached_ver
+            self.logger.debug("Using cached Proton version for AppID %s: %s", self.appid, self.proton_ver)
+            return True
+
         # --- Check config.vdf first for user-selected tool name ---
         try:
             # Reuse PathHandler's method to find config.vdf
             config_vdf_path = self.path_handler.find_steam_config_vdf()
             if config_vdf_path and config_vdf_path.exists():
-                import vdf # Assuming vdf library is available
-                with open(config_vdf_path, 'r') as f:
-                    data = vdf.load(f)
-                
-                # Navigate the VDF structure (adjust path as needed based on vdf library usage)
-                mapping = data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {}).get('CompatToolMapping', {})
-                app_mapping = mapping.get(str(self.appid), {})
-                tool_name = app_mapping.get('name', '')
+                # Only the CompatToolMapping section is needed, so scan for it instead of parsing the whole file
+                section = self._get_compat_mapping_section(config_vdf_path)
+                if section is not None:
+                    tool_name = _compat_tool_name_from_section(section, str(self.appid))
+                else:
+                    self.logger.debug("CompatToolMapping section not located by scan, falling back to full VDF parse.")
+                    data = VDFHandler.load_cached(config_vdf_path, binary=False) or {}
+                    
+                    # Navigate the VDF structure (adjust path as needed based on vdf library usage)
+                    mapping = data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {}).get('CompatToolMapping', {})
+                    app_mapping = mapping.get(str(self.appid), {})
+                    tool_name = app_mapping.get('name', '')
 
                 if tool_name and 'experimental' in tool_name.lower():
                     self.proton_ver = tool_name # Use the name from config.vdf (e.g., proton_experimental)
                     self.logger.info(f"Detected Proton tool from config.vdf: {self.proton_ver}")
+                    self._proton_ver_cache[self.appid] = self.proton_ver
                     return True
                 elif tool_name: # If found but not experimental, log it but proceed to reg check
-                    self.logger.debug(f"Proton tool from config.vdf: {tool_name}. Checking registry for runtime version.")
+                    self.logger.debug("Proton tool from config.vdf: %s. Checking registry for runtime version.", tool_name)
                 else:
-                    self.logger.debug(f"No specific Proton tool mapping found for AppID {self.appid} in config.vdf.")
+                    self.logger.debug("No specific Proton tool mapping found for AppID %s in config.vdf.", self.appid)
             else:
                  self.logger.debug("config.vdf not found, proceeding with registry check.")
 
@@ -468,12 +765,15 @@ class ModlistHandler:
         system_reg_path = self.compat_data_path / "pfx" / "system.reg"
         if system_reg_path.exists():
             try:
-                with open(system_reg_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                # Use regex to find the version string
-                match = re.search(r'"SteamClientProtonVersion"="([^"]+)"\r?', content)
+                # mmap the registry file so only the pages the regex touches are read
+                match = None
+                with open(system_reg_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            match = _PROTON_VER_RE.search(mm)
+                            if match:
+                                version_str = match.group(1).decode('utf-8', errors='ignore').strip()
                 if match:
-                    version_str = match.group(1).strip()
                     if version_str:
                         # Check if it's a GE version
                         if "GE" in version_str.upper():
@@ -481,6 +781,7 @@ class ModlistHandler:
                         else:
                              self.proton_ver = f"Proton {version_str}"
                         self.logger.info(f"Detected Proton runtime version from system.reg: {self.proton_ver}")
+                        self._proton_ver_cache[self.appid] = self.proton_ver
                         return True
                 else:
                      self.logger.debug("'SteamClientProtonVersion' not found in system.reg.")
@@ -494,8 +795,9 @@ class ModlistHandler:
         config_info_path = self.compat_data_path / "config_info"
         if config_info_path.exists():
             try:
-                with open(config_info_path, 'r') as f:
-                    version_str = f.readline().strip()
+                # The version is on the first line; a small binary read avoids text-mode setup
+                with open(config_info_path, 'rb') as f:
+                    version_str = f.read(128).split(b'\n', 1)[0].strip().decode('utf-8', 'ignore')
                 if version_str:
                     # Check if it's a GE version
                     if "GE" in version_str.upper():
@@ -503,6 +805,7 @@ class ModlistHandler:
                     else:
                         self.proton_ver = f"Proton {version_str}"
                     self.logger.info(f"Detected Proton runtime version from config_info: {self.proton_ver}")
+                    self._proton_ver_cache[self.appid] = self.proton_ver
                     return True
             except Exception as e:
                 self.logger.warning(f"Error reading config_info: {e}")
@@ -514,6 +817,46 @@ class ModlistHandler:
         # self.proton_ver remains "Unknown" from initialization
         return False
 
+    def _get_http_session(self):
+        """Shared requests.Session so the registry and font downloads reuse pooled keep-alive connections."""
+        if self._http is None:
+            import requests  # Deferred: only needed for the download steps
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=Retry(total=3, backoff_factor=0.2))
+            session.mount("https://", adapter)
+            self._http = session
+        return self._http
+
+    @staticmethod
+    def _atomic_write_stream(response, dest: Path) -> None:
+        """Stream a response body to dest via a fsynced temp file and os.replace, so dest is never left truncated."""
+        import shutil
+        tmp_path = f"{dest}.tmp"
+        try:
+            # decode_content undoes any gzip transfer encoding on .raw
+            response.raw.decode_content = True
+            with open(tmp_path, "wb", buffering=1024 * 1024) as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, dest)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _download_reg(self, url: str, dest: Path) -> None:
+        """Download a curated registry file and write it over the prefix's copy (raises on failure)."""
+        with self._get_http_session().get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            self._atomic_write_stream(response, dest)
+        self.logger.info(f"Curated {url.rsplit('/', 1)[-1]} downloaded and applied to {dest}")
+
     def display_modlist_summary(self, skip_confirmation: bool = False) -> bool:
         """Display the detected modlist summary and ask for confirmation."""
         if not self.appid or not self.modlist_dir or not self.modlist_ini:
@@ -527,16 +870,19 @@ class ModlistHandler:
              self._detect_proton_version()
 
         # Don't reset timing - continue from Steam Integration timing
-        print("=== Configuration Summary ===")
-        print(f"{self._get_progress_timestamp()} Selected Modlist: {self.game_name}")
-        print(f"{self._get_progress_timestamp()} Game Type: {self.game_var_full if self.game_var_full else 'Unknown'}")
-        print(f"{self._get_progress_timestamp()} Steam App ID: {self.appid}")
-        print(f"{self._get_progress_timestamp()} Modlist Directory: {self.modlist_dir}")
-        print(f"{self._get_progress_timestamp()} ModOrganizer.ini: {self.modlist_dir}/ModOrganizer.ini")
-        print(f"{self._get_progress_timestamp()} Proton Version: {self.proton_ver if self.proton_ver else 'Unknown'}")
-        print(f"{self._get_progress_timestamp()} Resolution: {self.selected_resolution if self.selected_resolution else 'Default'}")
-        print(f"{self._get_progress_timestamp()} Modlist on SD Card: {self.modlist_sdcard}")
-        print("")
+        ts = self._get_progress_timestamp()
+        sys.stdout.write("\n".join([
+            "=== Configuration Summary ===",
+            f"{ts} Selected Modlist: {self.game_name}",
+            f"{ts} Game Type: {self.game_var_full if self.game_var_full else 'Unknown'}",
+            f"{ts} Steam App ID: {self.appid}",
+            f"{ts} Modlist Directory: {self.modlist_dir}",
+            f"{ts} ModOrganizer.ini: {self.modlist_dir}/ModOrganizer.ini",
+            f"{ts} Proton Version: {self.proton_ver if self.proton_ver else 'Unknown'}",
+            f"{ts} Resolution: {self.selected_resolution if self.selected_resolution else 'Default'}",
+            f"{ts} Modlist on SD Card: {self.modlist_sdcard}",
+        ]) + "\n\n")
+        sys.stdout.flush()
 
         if skip_confirmation:
             return True
@@ -559,12 +905,17 @@ class ModlistHandler:
         self._current_status_callback = status_callback
         
         self.logger.info("Executing configuration steps...")
+        # Special game type (FNV/Enderal) is needed by Step 10 and Step 13; detect it once per run
+        self._special_game_type = self.detect_special_game_type(self.modlist_dir)
         
         # Ensure required context is set
         if not all([self.modlist_dir, self.appid, self.game_var, self.steamdeck is not None]):
             self.logger.error("Cannot execute configuration steps: Missing required context (modlist_dir, appid, game_var, steamdeck status).")
             print("Error: Missing required information to start configuration.")
             return False
+        # Path objects reused by Steps 5, 6, 8 and 11a
+        mld_path = Path(self.modlist_dir)
+        mli_path = Path(self.modlist_ini) if self.modlist_ini else None
             
         # Step 1: Set protontricks permissions
         if status_callback:
@@ -591,9 +942,9 @@ class ModlistHandler:
             compatdata_ok = False
             
             # Check Proton version
-            self.logger.debug(f"[MANUAL STEPS DEBUG] Checking Proton version for AppID {self.appid}")
+            self.logger.debug("[MANUAL STEPS DEBUG] Checking Proton version for AppID %s", self.appid)
             if self._detect_proton_version():
-                self.logger.debug(f"[MANUAL STEPS DEBUG] Detected Proton version: {self.proton_ver}")
+                self.logger.debug("[MANUAL STEPS DEBUG] Detected Proton version: %s", self.proton_ver)
                 if self.proton_ver and 'experimental' in self.proton_ver.lower():
                     proton_ok = True
                     self.logger.debug("[MANUAL STEPS DEBUG] Proton Experimental detected - proton_ok = True")
@@ -601,16 +952,17 @@ class ModlistHandler:
                 self.logger.debug("[MANUAL STEPS DEBUG] Could not detect Proton version")
                 
             # Check compatdata/prefix
-            prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
-            self.logger.debug(f"[MANUAL STEPS DEBUG] Compatdata path search result: {prefix_path_str}")
+            prefix_path_str = self._find_compat_data_cached(self.appid)
+            self.logger.debug("[MANUAL STEPS DEBUG] Compatdata path search result: %s", prefix_path_str)
 
-            if prefix_path_str and os.path.isdir(prefix_path_str):
+            prefix_st = self._stat_cached(prefix_path_str) if prefix_path_str else None
+            if prefix_st is not None and stat.S_ISDIR(prefix_st.st_mode):
                 compatdata_ok = True
                 self.logger.debug("[MANUAL STEPS DEBUG] Compatdata directory exists - compatdata_ok = True")
             else:
                 self.logger.debug("[MANUAL STEPS DEBUG] Compatdata directory does not exist")
                 
-            self.logger.debug(f"[MANUAL STEPS DEBUG] proton_ok: {proton_ok}, compatdata_ok: {compatdata_ok}")
+            self.logger.debug("[MANUAL STEPS DEBUG] proton_ok: %s, compatdata_ok: %s", proton_ok, compatdata_ok)
             
             if proton_ok and compatdata_ok:
                 self.logger.info("Proton Experimental and compatdata already set for this AppID; skipping manual steps prompt.")
@@ -618,7 +970,7 @@ class ModlistHandler:
             else:
                 self.logger.debug("[MANUAL STEPS DEBUG] Manual steps will be required")
                 
-        self.logger.debug(f"[MANUAL STEPS DEBUG] manual_steps_completed: {manual_steps_completed}, skip_manual_prompt: {skip_manual_prompt}")
+        self.logger.debug("[MANUAL STEPS DEBUG] manual_steps_completed: %s, skip_manual_prompt: %s", manual_steps_completed, skip_manual_prompt)
         
         if not manual_steps_completed and not skip_manual_prompt:
             # Check if we're in GUI mode - if so, don't show CLI prompts, just fail and let GUI callbacks handle it
@@ -646,23 +998,22 @@ class ModlistHandler:
             status_callback(f"{self._get_progress_timestamp()} Applying curated registry files for modlist configuration")
         self.logger.info("Step 3: Downloading and applying curated user.reg.modlist and system.reg.modlist...")
         try:
-            prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
-            if not prefix_path_str or not os.path.isdir(prefix_path_str):
+            prefix_path_str = self._find_compat_data_cached(self.appid)
+            prefix_st = self._stat_cached(prefix_path_str) if prefix_path_str else None
+            if prefix_st is None or not stat.S_ISDIR(prefix_st.st_mode):
                 raise Exception("Could not determine Wine prefix path for this modlist. Please ensure you have launched the shortcut from Steam at least once.")
             user_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/user.reg.modlist"
             user_reg_dest = Path(prefix_path_str) / "user.reg"
-            response = requests.get(user_reg_url, verify=True)
-            response.raise_for_status()
-            with open(user_reg_dest, "wb") as f:
-                f.write(response.content)
-            self.logger.info(f"Curated user.reg.modlist downloaded and applied to {user_reg_dest}")
             system_reg_url = "https://raw.githubusercontent.com/Omni-guides/Wabbajack-Modlist-Linux/refs/heads/main/files/system.reg.modlist"
             system_reg_dest = Path(prefix_path_str) / "system.reg"
-            response = requests.get(system_reg_url, verify=True)
-            response.raise_for_status()
-            with open(system_reg_dest, "wb") as f:
-                f.write(response.content)
-            self.logger.info(f"Curated system.reg.modlist downloaded and applied to {system_reg_dest}")
+            # Both files are small and latency-bound, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self._download_reg, user_reg_url, user_reg_dest),
+                    executor.submit(self._download_reg, system_reg_url, system_reg_dest),
+                ]
+                for future in futures:
+                    future.result()  # Re-raise any download/write error
         except Exception as e:
             self.logger.error(f"Failed to download or apply curated user.reg.modlist or system.reg.modlist: {e}")
             print(f"{COLOR_ERROR}Error: Failed to download or apply curated user.reg.modlist or system.reg.modlist. {e}{COLOR_RESET}")
@@ -716,9 +1067,7 @@ class ModlistHandler:
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Setting ownership and permissions for modlist directory")
         self.logger.info("Step 5: Setting ownership and permissions for modlist directory...")
-        # Convert modlist_dir string to Path object for the method
-        modlist_path_obj = Path(self.modlist_dir)
-        if not self.filesystem_handler.set_ownership_and_permissions_sudo(modlist_path_obj):
+        if not self.filesystem_handler.set_ownership_and_permissions_sudo(mld_path):
             self.logger.error("Failed to set ownership/permissions for modlist directory. Configuration aborted.")
             print("Error: Failed to set permissions for the modlist directory.")
             return False # Abort on failure
@@ -728,8 +1077,7 @@ class ModlistHandler:
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Backing up ModOrganizer.ini")
         self.logger.info(f"Step 6: Backing up {self.modlist_ini}...")
-        modlist_ini_path_obj = Path(self.modlist_ini)
-        backup_path = self.filesystem_handler.backup_file(modlist_ini_path_obj)
+        backup_path = self.filesystem_handler.backup_file(mli_path)
         if not backup_path:
             self.logger.error("Failed to back up ModOrganizer.ini. Configuration aborted.")
             print("Error: Failed to back up ModOrganizer.ini.")
@@ -745,6 +1093,7 @@ class ModlistHandler:
             self.logger.error("Failed during stock game path detection.")
             print("Error: Failed during stock game path detection.")
             return False
+        stock_game_path_obj = Path(self.stock_game_path) if self.stock_game_path else None
 
         # Step 7b: Detect Steam Library Info (Needed for Step 8)
         if status_callback:
@@ -762,13 +1111,10 @@ class ModlistHandler:
         self.logger.info("Step 8: Updating gamePath, Binary, and workingDirectory paths in ModOrganizer.ini...")
         
         # Update gamePath using replace_gamepath method
-        modlist_dir_path_obj = Path(self.modlist_dir)
-        modlist_ini_path_obj = Path(self.modlist_ini)
-        stock_game_path_obj = Path(self.stock_game_path) if self.stock_game_path else None
         # Only call replace_gamepath if we have a valid stock game path
         if stock_game_path_obj:
             if not self.path_handler.replace_gamepath(
-                modlist_ini_path=modlist_ini_path_obj, 
+                modlist_ini_path=mli_path, 
                 new_game_path=stock_game_path_obj,
                 modlist_sdcard=self.modlist_sdcard
             ):
@@ -789,11 +1135,11 @@ class ModlistHandler:
                 # self.steam_library is steamapps/common, need to go up 2 levels to get library root
                 steam_library_root = Path(self.steam_library).parent.parent
                 steam_libraries = [steam_library_root]
-                self.logger.debug(f"Using Steam library root: {steam_library_root}")
+                self.logger.debug("Using Steam library root: %s", steam_library_root)
             
             if not self.path_handler.edit_binary_working_paths(
-                modlist_ini_path=modlist_ini_path_obj,
-                modlist_dir_path=modlist_dir_path_obj,
+                modlist_ini_path=mli_path,
+                modlist_dir_path=mld_path,
                 modlist_sdcard=self.modlist_sdcard,
                 steam_libraries=steam_libraries
             ):
@@ -804,17 +1150,29 @@ class ModlistHandler:
             self.logger.debug("Skipping path manipulation - jackify-engine already set correct paths in ModOrganizer.ini")
         self.logger.info("Step 8: Updating ModOrganizer.ini paths... Done")
 
+        # Start the Step 11b font download now so its network latency overlaps Steps 9-11a
+        font_url = "https://github.com/mrbvrz/segoe-ui-linux/raw/refs/heads/master/font/seguisym.ttf"
+        font_dest_path = None
+        font_future = None
+        prefix_path_str = self._find_compat_data_cached(self.appid)
+        if prefix_path_str:
+            font_dest_path = Path(prefix_path_str) / "pfx" / "drive_c" / "windows" / "Fonts" / "seguisym.ttf"
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+            # Pass quiet=True to suppress print during configuration steps
+            font_future = self._io_pool.submit(self.filesystem_handler.download_file, font_url, font_dest_path,
+                                               quiet=True, session=self._get_http_session())
+
+        # Vanilla game directory path, used as a fallback by Step 9 and Step 10
+        vanilla_game_dir = None
+        if self.steam_library and self.game_var_full:
+            vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
+
         # Step 9: Update Resolution Settings (if applicable)
         if hasattr(self, 'selected_resolution') and self.selected_resolution:
             if status_callback:
                 status_callback(f"{self._get_progress_timestamp()} Updating resolution settings")
             # Ensure resolution_handler call uses correct args if needed
             # Assuming it uses modlist_dir (str) and game_var_full (str)
-            # Construct vanilla game directory path for fallback
-            vanilla_game_dir = None
-            if self.steam_library and self.game_var_full:
-                vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
-
             if not ResolutionHandler.update_ini_resolution(
                 modlist_dir=self.modlist_dir,
                 game_var=self.game_var_full,
@@ -828,14 +1186,8 @@ class ModlistHandler:
             self.logger.info("Step 9: Skipping resolution update (no resolution selected).")
 
         # Step 10: Create dxvk.conf (skip for special games using vanilla compatdata)
-        special_game_type = self.detect_special_game_type(self.modlist_dir)
-        self.logger.debug(f"DXVK step - modlist_dir='{self.modlist_dir}', special_game_type='{special_game_type}'")
-        
-        # Force check specific files for debugging
-        nvse_path = Path(self.modlist_dir) / "nvse_loader.exe" if self.modlist_dir else None
-        enderal_path = Path(self.modlist_dir) / "Enderal Launcher.exe" if self.modlist_dir else None
-        self.logger.debug(f"nvse_loader.exe exists: {nvse_path.exists() if nvse_path else 'N/A'}")
-        self.logger.debug(f"Enderal Launcher.exe exists: {enderal_path.exists() if enderal_path else 'N/A'}")
+        special_game_type = self._special_game_type
+        self.logger.debug("DXVK step - modlist_dir='%s', special_game_type='%s'", self.modlist_dir, special_game_type)
         
         if special_game_type:
             self.logger.info(f"Step 10: Skipping dxvk.conf creation for {special_game_type.upper()} (uses vanilla compatdata)")
@@ -846,11 +1198,6 @@ class ModlistHandler:
                 status_callback(f"{self._get_progress_timestamp()} Creating dxvk.conf file")
             self.logger.info("Step 10: Creating dxvk.conf file...")
             # Assuming create_dxvk_conf still uses string paths
-            # Construct vanilla game directory path for fallback
-            vanilla_game_dir = None
-            if self.steam_library and self.game_var_full:
-                vanilla_game_dir = str(Path(self.steam_library) / "steamapps" / "common" / self.game_var_full)
-                
             if not self.path_handler.create_dxvk_conf(
                 modlist_dir=self.modlist_dir, 
                 modlist_sdcard=self.modlist_sdcard, 
@@ -867,7 +1214,7 @@ class ModlistHandler:
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Deleting incompatible MO2 plugin")
         self.logger.info("Step 11a: Deleting incompatible MO2 plugin (FixGameRegKey.py)...")
-        plugin_path = Path(self.modlist_dir) / "plugins" / "FixGameRegKey.py"
+        plugin_path = mld_path / "plugins" / "FixGameRegKey.py"
         if plugin_path.exists():
             try:
                 plugin_path.unlink()
@@ -882,15 +1229,16 @@ class ModlistHandler:
         # Step 11b: Download Font
         if status_callback:
             status_callback(f"{self._get_progress_timestamp()} Downloading required font")
-        prefix_path_str = self.path_handler.find_compat_data(str(self.appid))
-        if prefix_path_str:
-            prefix_path = Path(prefix_path_str)
-            fonts_dir = prefix_path / "pfx" / "drive_c" / "windows" / "Fonts"
-            font_url = "https://github.com/mrbvrz/segoe-ui-linux/raw/refs/heads/master/font/seguisym.ttf"
-            font_dest_path = fonts_dir / "seguisym.ttf"
-            
-            # Pass quiet=True to suppress print during configuration steps
-            if not self.filesystem_handler.download_file(font_url, font_dest_path, quiet=True):
+        if font_future is not None:
+            try:
+                font_downloaded = font_future.result(timeout=60)
+            except Exception as e:
+                self.logger.warning(f"Font download did not complete: {e}")
+                font_downloaded = False
+            finally:
+                self._io_pool.shutdown(wait=False)
+                self._io_pool = None
+            if not font_downloaded:
                 self.logger.warning(f"Failed to download {font_url} to {font_dest_path}")
                 print("Warning: Failed to download necessary font file (seguisym.ttf).")
                 # Continue anyway, not critical for all lists
@@ -909,7 +1257,7 @@ class ModlistHandler:
 
         # Step 13: Launch options for special games are now set during automated prefix workflow (before Steam restart)
         # This ensures proper timing and avoids the need for a second Steam restart
-        special_game_type = self.detect_special_game_type(self.modlist_dir)
+        special_game_type = self._special_game_type
         if special_game_type:
             self.logger.info(f"Step 13: Launch options for {special_game_type.upper()} were set during automated workflow")
         else:
@@ -941,7 +1289,7 @@ class ModlistHandler:
         self.logger.info(f"Detected Steam Library: {self.steam_library}")
         
         # Check if the base game library is on SD card
-        self.logger.debug(f"Checking if Steam Library {self.steam_library} is on SD card...")
+        self.logger.debug("Checking if Steam Library %s is on SD card...", self.steam_library)
         steam_lib_path_obj = Path(self.steam_library)
         self.basegame_sdcard = self.filesystem_handler.is_sd_card(steam_lib_path_obj)
         self.logger.info(f"Base game library on SD card: {self.basegame_sdcard}")
@@ -955,27 +1303,26 @@ class ModlistHandler:
             self.logger.error("Modlist directory not set, cannot detect stock game path.")
             return False
 
-        modlist_path = Path(self.modlist_dir)
-        common_names = [
-            "Stock Game",
-            "Game Root",
-            "STOCK GAME",
-            "Stock Game Folder",
-            "Stock Folder",
-            "Skyrim Stock",
-            Path("root/Skyrim Special Edition") # Special case for some lists
-            # Add other common names if needed
-        ]
-
+        # One directory listing instead of a stat per candidate name; lower rank wins
         found_path = None
-        for name in common_names:
-            potential_path = modlist_path / name
-            if potential_path.is_dir():
-                found_path = str(potential_path)
-                self.logger.info(f"Found potential stock game directory: {found_path}")
-                break # Found the first match
+        found_rank = len(_STOCK_GAME_NAMES)
+        try:
+            with os.scandir(self.modlist_dir) as it:
+                for entry in it:
+                    rank = _STOCK_GAME_NAMES.get(entry.name.lower())
+                    if rank is not None and rank < found_rank and entry.is_dir():
+                        found_path, found_rank = entry.path, rank
+                        if rank == 0:
+                            break
+        except OSError as e:
+            self.logger.warning(f"Could not list modlist directory {self.modlist_dir}: {e}")
+        if found_path is None:
+            nested_path = os.path.join(self.modlist_dir, "root", "Skyrim Special Edition") # Special case for some lists
+            if os.path.isdir(nested_path):
+                found_path = nested_path
         
         if found_path:
+            self.logger.info(f"Found potential stock game directory: {found_path}")
             self.stock_game_path = found_path
             # Suppress print during configuration
             # print(f"Step 7a: Found stock game directory: {os.path.basename(found_path)}") 
@@ -1013,66 +1360,80 @@ class ModlistHandler:
         compatdata_path_found = None
         prefix_exists = False
 
-        # 1. Find and Parse config.vdf
-        config_vdf_path = None
-        possible_steam_paths = [
-            Path.home() / ".steam/steam",
-            Path.home() / ".local/share/Steam",
-            Path.home() / ".steam/root"
-        ]
-        for steam_path in possible_steam_paths:
-            potential_path = steam_path / "config/config.vdf"
-            if potential_path.is_file():
-                config_vdf_path = potential_path
-                self.logger.debug(f"Found config.vdf at: {config_vdf_path}")
-                break
+        # 1. Find and Parse config.vdf (location is remembered across verification retries)
+        config_vdf_path = self._config_vdf_path
+        if config_vdf_path is None or not os.path.exists(config_vdf_path):
+            config_vdf_path = None
+            possible_steam_paths = [
+                Path.home() / ".local/share/Steam",  # Most common install location first
+                Path.home() / ".steam/steam",
+                Path.home() / ".steam/root"
+            ]
+            for steam_path in possible_steam_paths:
+                potential_path = steam_path / "config/config.vdf"
+                if os.path.isfile(potential_path):
+                    config_vdf_path = potential_path
+                    self.logger.debug("Found config.vdf at: %s", config_vdf_path)
+                    break
+            self._config_vdf_path = config_vdf_path
         
         if not config_vdf_path:
             self.logger.error("Could not locate Steam's config.vdf file.")
             return False, 'config_vdf_missing'
 
-        # Add a short delay to allow Steam to potentially finish writing changes
-        self.logger.debug("Waiting 2 seconds before reading config.vdf...")
-        time.sleep(2)
+        # Allow Steam to finish writing changes: wait (up to 2 seconds) for config.vdf's mtime to hold steady
+        self.logger.debug("Waiting for config.vdf to settle before reading...")
+        self._wait_file_settled(config_vdf_path)
 
         try:
-            self.logger.debug(f"Attempting to load VDF file: {config_vdf_path}")
-            # CORRECTION: Use the vdf library directly here, not VDFHandler
-            with open(str(config_vdf_path), 'r') as f:
-                 config_data = vdf.load(f, mapper=vdf.VDFDict)
-
-            # --- Write full config.vdf to a debug file ---
-            import json
-            debug_dump_path = os.path.expanduser("~/dev/Jackify/configvdf_dump.txt")
-            with open(debug_dump_path, "w") as dump_f:
-                json.dump(config_data, dump_f, indent=2)
-            self.logger.info(f"Full config.vdf dumped to {debug_dump_path}")
-
-            # --- Log only the relevant section for this AppID ---
-            steam_config_section = config_data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {})
-            compat_mapping = steam_config_section.get('CompatToolMapping', {})
-            app_mapping = compat_mapping.get(appid_to_check, {})
-            self.logger.debug("───────────────────────────────────────────────────────────────────")
-            self.logger.debug(f"Config.vdf entry for AppID {appid_to_check} (CompatToolMapping):")
-            self.logger.debug(json.dumps({appid_to_check: app_mapping}, indent=2))
-            self.logger.debug("───────────────────────────────────────────────────────────────────")
-            self.logger.debug(f"Steam config section from VDF: {json.dumps(steam_config_section, indent=2)}")
-            # --- End Debugging ---
-            
-            # Navigate the structure: Software -> Valve -> Steam -> CompatToolMapping -> appid_to_check -> Name
-            compat_mapping = steam_config_section.get('CompatToolMapping', {})
-            app_mapping = compat_mapping.get(appid_to_check, {})
-            proton_tool_name = app_mapping.get('name') # CORRECTED: Use lowercase 'name'
-            self.proton_ver = proton_tool_name # Store detected version
+            # Targeted scan of the CompatToolMapping section; the full VDF parse is only needed when
+            # the scan can't find the entry, or for the opt-in JACKIFY_DEBUG_VDF dump
+            section = self._get_compat_mapping_section(config_vdf_path)
+            proton_tool_name = _compat_tool_name_from_section(section, appid_to_check) if section is not None else ''
+            debug_vdf = os.environ.get('JACKIFY_DEBUG_VDF') == '1' and self.logger.isEnabledFor(logging.DEBUG)
+
+            if proton_tool_name and not debug_vdf:
+                self.logger.debug("CompatToolMapping name for AppID %s from targeted scan: %s", appid_to_check, proton_tool_name)
+            else:
+                self.logger.debug("Attempting to load VDF file: %s", config_vdf_path)
+                # CORRECTION: Use the vdf library directly here, not VDFHandler
+                import vdf
+                with open(str(config_vdf_path), 'r') as f:
+                     config_data = vdf.load(f, mapper=vdf.VDFDict)
+
+                # --- Write full config.vdf to a debug file (opt-in: debug logging + JACKIFY_DEBUG_VDF=1) ---
+                if debug_vdf:
+                    debug_dump_path = os.path.expanduser("~/dev/Jackify/configvdf_dump.txt")
+                    with open(debug_dump_path, "w") as dump_f:
+                        json.dump(config_data, dump_f, indent=2)
+                    self.logger.info(f"Full config.vdf dumped to {debug_dump_path}")
+
+                # --- Log only the relevant section for this AppID ---
+                steam_config_section = config_data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {})
+                compat_mapping = steam_config_section.get('CompatToolMapping', {})
+                app_mapping = compat_mapping.get(appid_to_check, {})
+                self.logger.debug("───────────────────────────────────────────────────────────────────")
+                self.logger.debug("Config.vdf entry for AppID %s (CompatToolMapping):", appid_to_check)
+                self.logger.debug("%s", _LazyJson({appid_to_check: app_mapping}))
+                self.logger.debug("───────────────────────────────────────────────────────────────────")
+                self.logger.debug("Steam config section from VDF: %s", _LazyJson(steam_config_section))
+                # --- End Debugging ---
+
+                # Navigate the structure: Software -> Valve -> Steam -> CompatToolMapping -> appid_to_check -> Name
+                proton_tool_name = app_mapping.get('name') # CORRECTED: Use lowercase 'name'
+            self.proton_ver = proton_tool_name or None # Store detected version
             
             if proton_tool_name:
                 self.logger.info(f"Proton tool name from config.vdf: {proton_tool_name}")
             else:
                  self.logger.warning(f"CompatToolMapping entry not found for AppID {appid_to_check} in config.vdf.")
                  # Add more debug info here about what *was* found
-                 self.logger.debug(f"CompatToolMapping contents: {json.dumps(compat_mapping.get(appid_to_check, 'Key not found'), indent=2)}")
+                 self.logger.debug("CompatToolMapping contents: %s", _LazyJson(compat_mapping.get(appid_to_check, 'Key not found')))
                  return False, 'proton_check_failed' # Compatibility not explicitly set
 
+        except ImportError:
+            self.logger.error("Python 'vdf' library not found. Cannot read config.vdf.")
+            return False, 'config_vdf_error'
         except FileNotFoundError:
             self.logger.error(f"Config.vdf file not found during load attempt: {config_vdf_path}")
             return False, 'config_vdf_missing'
@@ -1089,28 +1450,35 @@ class ModlistHandler:
         self.logger.info("Proton version check passed ('Proton Experimental' set).")
 
         # 3. Check for compatdata / prefix directory existence
-        possible_compat_bases = [
+        # The Steam root that holds config.vdf is the one in use, so its compatdata is checked first
+        config_root_compat = Path(config_vdf_path).parent.parent / "steamapps" / "compatdata"
+        possible_compat_bases = [config_root_compat] + [base for base in (
             Path.home() / ".steam/steam/steamapps/compatdata",
             Path.home() / ".local/share/Steam/steamapps/compatdata",
              # Add SD card paths if necessary / detectable
              # Path("/run/media/mmcblk0p1/steamapps/compatdata") # Example
-        ]
+        ) if base != config_root_compat]
         
         compat_dir_found = False
         for base_path in possible_compat_bases:
             potential_compat_path = base_path / appid_to_check
-            if potential_compat_path.is_dir():
-                self.logger.debug(f"Found compatdata directory: {potential_compat_path}")
+            prefix_path = potential_compat_path / "pfx"
+            # An existing pfx directory implies the compatdata directory, so one stat covers the usual case
+            try:
+                prefix_is_dir = stat.S_ISDIR(os.stat(prefix_path).st_mode)
+            except OSError:
+                prefix_is_dir = False
+            if prefix_is_dir:
+                self.logger.debug("Found compatdata directory: %s", potential_compat_path)
+                self.logger.info(f"Wine prefix directory verified: {prefix_path}")
                 compat_dir_found = True
-                # Check for prefix *within* the found compatdata dir
-                prefix_path = potential_compat_path / "pfx"
-                if prefix_path.is_dir():
-                     self.logger.info(f"Wine prefix directory verified: {prefix_path}")
-                     prefix_exists = True
-                     break # Found both compatdata and prefix, exit loop
-                else:
-                     self.logger.warning(f"Compatdata directory found, but prefix missing: {prefix_path}")
-                     # Keep searching other base paths in case prefix exists elsewhere
+                prefix_exists = True
+                break # Found both compatdata and prefix, exit loop
+            if os.path.isdir(potential_compat_path):
+                self.logger.debug("Found compatdata directory: %s", potential_compat_path)
+                compat_dir_found = True
+                self.logger.warning(f"Compatdata directory found, but prefix missing: {prefix_path}")
+                # Keep searching other base paths in case prefix exists elsewhere
             
         if not compat_dir_found:
              self.logger.error(f"Compatdata directory not found for AppID {appid_to_check} in standard locations.")
@@ -1131,6 +1499,9 @@ class ModlistHandler:
         This orchestrates all the individual steps.
         """
         self.logger.info(f"Starting configuration phase for modlist: {self.game_name}")
+        # Re-resolve the prefix on every run; within the run, lookups are served from the cache
+        self._compatdata_cache.clear()
+        self._path_stat_cache.clear()
         # Call the private method that contains the actual steps
         # Pass along the status_callback if it was provided in the context
         status_callback = context.get('status_callback') if context else None
@@ -1142,35 +1513,54 @@ class ModlistHandler:
         to the grid directory of all non-zero Steam user directories, named after the new AppID.
         """
         steam_icons_dir = Path(modlist_dir) / "SteamIcons"
-        if not steam_icons_dir.is_dir():
+        try:
+            with os.scandir(steam_icons_dir) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
             self.logger.info(f"No SteamIcons directory found at {steam_icons_dir}, skipping grid image copy.")
             return
 
+        images = [
+            ("grid-hero.png", f"{appid}_hero.png"),
+            ("grid-logo.png", f"{appid}_logo.png"),
+            ("grid-tall.png", f"{appid}.png"),
+            ("grid-tall.png", f"{appid}p.png"),
+        ]
+        if present.isdisjoint(src for src, _ in images):
+            self.logger.info(f"No grid images found in {steam_icons_dir}, skipping grid image copy.")
+            return
+
+        # Read each source image once; the same bytes are written for every user and destination name
+        image_data = {}
+        for src_name in dict.fromkeys(src for src, _ in images if src in present):
+            try:
+                image_data[src_name] = (steam_icons_dir / src_name).read_bytes()
+            except OSError as e:
+                self.logger.error(f"Failed to read {steam_icons_dir / src_name}: {e}")
+
         # Find all non-zero Steam user directories
         userdata_base = Path.home() / ".steam/steam/userdata"
         if not userdata_base.is_dir():
             self.logger.error(f"Steam userdata directory not found at {userdata_base}")
             return
 
-        for user_dir in userdata_base.iterdir():
-            if not user_dir.is_dir() or user_dir.name == "0":
-                continue
-            grid_dir = user_dir / "config/grid"
-            grid_dir.mkdir(parents=True, exist_ok=True)
+        # Steam user directories are numeric account IDs; d_type from scandir avoids a stat per entry
+        with os.scandir(userdata_base) as it:
+            user_dirs = [entry.path for entry in it
+                         if entry.name.isdigit() and entry.name != "0" and entry.is_dir(follow_symlinks=False)]
 
-            images = [
-                ("grid-hero.png", f"{appid}_hero.png"),
-                ("grid-logo.png", f"{appid}_logo.png"),
-                ("grid-tall.png", f"{appid}.png"),
-                ("grid-tall.png", f"{appid}p.png"),
-            ]
+        for user_dir in user_dirs:
+            grid_dir = Path(user_dir) / "config/grid"
+            grid_dir.mkdir(parents=True, exist_ok=True)
 
             for src_name, dest_name in images:
                 src_path = steam_icons_dir / src_name
                 dest_path = grid_dir / dest_name
-                if src_path.exists():
+                data = image_data.get(src_name)
+                if data is not None:
                     try:
-                        shutil.copyfile(src_path, dest_path)
+                        with open(dest_path, 'wb') as f:
+                            f.write(data)
                         self.logger.info(f"Copied {src_path} to {dest_path}")
                     except Exception as e:
                         self.logger.error(f"Failed to copy {src_path} to {dest_path}: {e}")
@@ -1184,37 +1574,12 @@ class ModlistHandler:
         - Adds game-specific extras (from bash script logic)
         - Adds any modlist-specific extras (from MODLIST_WINE_COMPONENTS)
         """
-        default_components = ["fontsmooth=rgb", "xact", "xact_x64", "vcrun2022"]
-        extras = []
-        # Determine game type
-        game = (game_var_full or modlist_name or "").lower().replace(" ", "")
-        # Add game-specific extras
-        if "skyrim" in game or "fallout4" in game or "starfield" in game or "oblivion_remastered" in game or "enderal" in game:
-            extras += ["d3dcompiler_47", "d3dx11_43", "d3dcompiler_43", "dotnet6", "dotnet7"]
-        elif "falloutnewvegas" in game or "fnv" in game or "oblivion" in game:
-            extras += ["d3dx9_43", "d3dx9"]
-        # Add modlist-specific extras
-        modlist_lower = modlist_name.lower().replace(" ", "") if modlist_name else ""
-        for key, components in self.MODLIST_WINE_COMPONENTS.items():
-            if key in modlist_lower:
-                extras += components
-        # Remove duplicates while preserving order
-        seen = set()
-        full_list = [x for x in default_components + extras if not (x in seen or seen.add(x))]
-        return full_list
+        # Copy so callers can't mutate the cached result
+        return list(_compute_wine_components(modlist_name or "", game_var_full or "",
+                                             self._MODLIST_WINE_COMPONENTS_NORM))
 
     def _is_steam_deck(self):
-        try:
-            if os.path.exists('/etc/os-release'):
-                with open('/etc/os-release') as f:
-                    if 'steamdeck' in f.read().lower():
-                        return True
-            user_services = subprocess.run(['systemctl', '--user', 'list-units', '--type=service', '--no-pager'], capture_output=True, text=True)
-            if 'app-steam@autostart.service' in user_services.stdout:
-                return True
-        except Exception as e:
-            self.logger.warning(f"Error detecting Steam Deck: {e}")
-        return False
+        return _detect_steam_deck()
 
     def _prompt_or_set_resolution(self):
         # If on Steam Deck, set 1280x800 automatically
@@ -1227,7 +1592,7 @@ class ModlistHandler:
             if response == 'y':
                 while True:
                     user_res = input("Enter resolution (e.g., 1920x1080): ").strip()
-                    if re.match(r'^[0-9]+x[0-9]+$', user_res):
+                    if _RESOLUTION_RE.match(user_res):
                         self.selected_resolution = user_res
                         self.logger.info(f"User selected resolution: {user_res}")
                         break
@@ -1253,13 +1618,43 @@ class ModlistHandler:
         """
         if not modlist_dir:
             return None
-            
-        modlist_path = Path(modlist_dir)
-        if not modlist_path.exists() or not modlist_path.is_dir():
-            self.logger.debug(f"Modlist directory does not exist: {modlist_dir}")
+
+        try:
+            st = os.stat(modlist_dir)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            self.logger.debug("Modlist directory does not exist: %s", modlist_dir)
             return None
-            
-        self.logger.debug(f"Checking for special game type in: {modlist_dir}")
+
+        # Adding or removing files in the modlist directory bumps its mtime and invalidates the entry
+        game_var = getattr(self, 'game_var', None)
+        cache_key = (os.fspath(modlist_dir), game_var if isinstance(game_var, str) else None)
+        cached = self._special_type_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        result = self._detect_special_game_type_uncached(Path(modlist_dir))
+        self._special_type_cache[cache_key] = (st.st_mtime_ns, result)
+        return result
+
+    def _detect_special_game_type_uncached(self, modlist_path: Path) -> Optional[str]:
+        """Body of detect_special_game_type; modlist_path is known to be an existing directory."""
+        modlist_dir = os.fspath(modlist_path)
+        self.logger.debug("Checking for special game type in: %s", modlist_dir)
+
+        # Known game type in handler state is free to check, so try it before any file I/O
+        try:
+            game_type = getattr(self, 'game_var', None)
+            if isinstance(game_type, str):
+                gt = game_type.strip().lower()
+                if 'fallout new vegas' in gt or gt == 'fnv':
+                    self.logger.info("Heuristic detection: game_var indicates FNV")
+                    return "fnv"
+                if 'enderal' in gt:
+                    self.logger.info("Heuristic detection: game_var indicates Enderal")
+                    return "enderal"
+        except Exception:
+            pass
 
         # Check ModOrganizer.ini for indicators (nvse/enderal) as an early, robust signal
         try:
@@ -1272,56 +1667,53 @@ class ModlistHandler:
             
             if mo2_ini.exists():
                 try:
-                    content = mo2_ini.read_text(errors='ignore').lower()
-                    if 'nvse' in content or 'nvse_loader' in content or 'fallout new vegas' in content or 'falloutnv' in content:
-                        self.logger.info("Detected FNV via ModOrganizer.ini markers")
-                        return "fnv"
+                    # Stream the raw bytes in chunks (overlapping so markers can't straddle a boundary)
+                    # and stop at the first FNV marker, which takes precedence over Enderal ones
+                    enderal_marker_found = False
+                    tail = b''
+                    with mo2_ini.open('rb') as f:
+                        while True:
+                            chunk = f.read(8192)
+                            if not chunk:
+                                break
+                            window = tail + chunk
+                            for match in _MO2_MARKERS_RE.finditer(window):
+                                if match.group(1):
+                                    self.logger.info("Detected FNV via ModOrganizer.ini markers")
+                                    return "fnv"
+                                enderal_marker_found = True
+                            tail = window[-64:]
                     # Look for Enderal-specific patterns, not just the word "enderal"
-                    if any(pattern in content for pattern in ['enderal launcher', 'enderal.exe', 'enderal launcher.exe', 'enderalsteam']):
+                    if enderal_marker_found:
                         self.logger.info("Detected Enderal via ModOrganizer.ini markers")
                         return "enderal"
                 except Exception as e:
-                    self.logger.debug(f"Failed reading ModOrganizer.ini for detection: {e}")
+                    self.logger.debug("Failed reading ModOrganizer.ini for detection: %s", e)
         except Exception:
             pass
 
         # Check for FNV (Fallout New Vegas) and Enderal launchers in common locations
-        candidates = [modlist_path]
-        try:
-            # Include common stock game subfolders if present
-            from .path_handler import STOCK_GAME_FOLDERS
-            for folder_name in STOCK_GAME_FOLDERS:
-                sub = modlist_path / folder_name
-                if sub.exists() and sub.is_dir():
-                    candidates.append(sub)
-        except Exception:
-            # If import fails, continue with root-only
-            pass
+        candidates = [modlist_dir]
+        # Include common stock game subfolders if present
+        for folder_name in STOCK_GAME_FOLDERS:
+            sub = os.path.join(modlist_dir, folder_name)
+            if os.path.isdir(sub):
+                candidates.append(sub)
 
         for base in candidates:
-            nvse_loader = base / "nvse_loader.exe"
-            if nvse_loader.exists():
+            # One directory listing per candidate instead of a stat per launcher name
+            try:
+                with os.scandir(base) as it:
+                    names = {entry.name.lower() for entry in it if entry.is_file()}
+            except OSError:
+                continue
+            if "nvse_loader.exe" in names:
                 self.logger.info(f"Detected FNV modlist: found nvse_loader.exe in '{base}'")
                 return "fnv"
-            enderal_launcher = base / "Enderal Launcher.exe"
-            if enderal_launcher.exists():
+            if "enderal launcher.exe" in names:
                 self.logger.info(f"Detected Enderal modlist: found Enderal Launcher.exe in '{base}'")
                 return "enderal"
 
-        # As a final heuristic, use known game type if available in handler state
-        try:
-            game_type = getattr(self, 'game_var', None)
-            if isinstance(game_type, str):
-                gt = game_type.strip().lower()
-                if 'fallout new vegas' in gt or gt == 'fnv':
-                    self.logger.info("Heuristic detection: game_var indicates FNV")
-                    return "fnv"
-                if 'enderal' in gt:
-                    self.logger.info("Heuristic detection: game_var indicates Enderal")
-                    return "enderal"
-        except Exception:
-            pass
-            
         # Not a special game type
         self.logger.debug("No special game type detected - standard workflow will be used")
         return None
@@ -1341,7 +1733,7 @@ class ModlistHandler:
             from ..handlers.path_handler import PathHandler
 
             # Get prefix path for the AppID
-            prefix_path = PathHandler.find_compat_data(str(self.appid))
+            prefix_path = self._find_compat_data_cached(self.appid)
             if not prefix_path:
                 self.logger.warning("Cannot re-enforce Windows 10 mode - prefix path not found")
                 return
@@ -9,9 +9,11 @@ import os
 import re
 import logging
 import shutil
+import functools
 from pathlib import Path
 from typing import Optional, Union, Dict, Any, List, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -23,6 +25,13 @@ TARGET_EXECUTABLES_LOWER = ["skse64_loader.exe", "f4se_loader.exe", "nvse_loader
 STOCK_GAME_FOLDERS = ["Stock Game", "Game Root", "Stock Folder", "Skyrim Stock"]
 # Define the SD card path prefix on Steam Deck/Linux
 SDCARD_PREFIX = '/run/media/mmcblk0p1/'
+# Known libraryfolders.vdf locations (native, legacy symlinks and Flatpak)
+LIBRARYFOLDERS_VDF_PATHS = [
+    Path.home() / ".steam/steam/config/libraryfolders.vdf",
+    Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
+    Path.home() / ".steam/root/config/libraryfolders.vdf",
+    Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf",  # Flatpak
+]
 
 class PathHandler:
     """
@@ -383,7 +392,27 @@ class PathHandler:
     
     @staticmethod
     def find_steam_library() -> Optional[Path]:
-        """Find the primary Steam library common directory containing games."""
+        """Find the primary Steam library common directory containing games.
+
+        The result is cached per HOME and ~/.steam mtime; call
+        clear_steam_library_cache() after Steam is restarted.
+        """
+        home = os.path.expanduser("~")
+        try:
+            steam_mtime_ns = os.stat(os.path.join(home, ".steam")).st_mtime_ns
+        except OSError:
+            steam_mtime_ns = None
+        return PathHandler._find_steam_library_cached(home, steam_mtime_ns)
+
+    @classmethod
+    def clear_steam_library_cache(cls) -> None:
+        """Drop the cached find_steam_library() result."""
+        cls._find_steam_library_cached.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_steam_library_cached(home: str, steam_mtime_ns: Optional[int]) -> Optional[Path]:
+        """Uncached Steam library lookup; arguments only serve as the cache key."""
         logger.debug("Attempting to find Steam library...")
         
         # Potential locations for libraryfolders.vdf
@@ -606,14 +635,8 @@ class PathHandler:
     def get_all_steam_library_paths() -> List[Path]:
         """Finds all Steam library paths listed in all known libraryfolders.vdf files (including Flatpak)."""
         logger.info("[DEBUG] Searching for all Steam libraryfolders.vdf files...")
-        vdf_paths = [
-            Path.home() / ".steam/steam/config/libraryfolders.vdf",
-            Path.home() / ".local/share/Steam/config/libraryfolders.vdf",
-            Path.home() / ".steam/root/config/libraryfolders.vdf",
-            Path.home() / ".var/app/com.valvesoftware.Steam/.local/share/Steam/config/libraryfolders.vdf",  # Flatpak
-        ]
         library_paths = set()
-        for vdf_path in vdf_paths:
+        for vdf_path in LIBRARYFOLDERS_VDF_PATHS:
             if vdf_path.is_file():
                 logger.info(f"[DEBUG] Parsing libraryfolders.vdf: {vdf_path}")
                 try:
@@ -628,6 +651,17 @@ class PathHandler:
         logger.info(f"[DEBUG] All detected Steam libraries: {library_paths}")
         return list(library_paths)
 
+    @staticmethod
+    def get_libraryfolders_vdf_stamp() -> Tuple:
+        """Returns a cheap change stamp (mtime_ns per known libraryfolders.vdf) for cache validation."""
+        stamp = []
+        for vdf_path in LIBRARYFOLDERS_VDF_PATHS:
+            try:
+                stamp.append(os.stat(vdf_path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
     # Moved _find_shortcuts_vdf here from ShortcutHandler
     def _find_shortcuts_vdf(self) -> Optional[str]:
         """Helper to find the active shortcuts.vdf file for the current Steam user.
@@ -655,11 +689,43 @@ class PathHandler:
             logger.error(f"Error using multi-user detection for shortcuts.vdf: {e}")
             return None
 
+    @staticmethod
+    def _scan_library_for_games(library_path: Path, target_appids: Dict[str, str]) -> Dict[str, Path]:
+        """Look for each target game's appmanifest in a single Steam library."""
+        results = {}
+        # Check if the common directory exists
+        common_dir = library_path / "common"
+        if not common_dir.is_dir():
+            logger.debug(f"No 'common' directory in library: {library_path}")
+            return results
+
+        # For each app ID, check if we find its directory
+        for game_name, app_id in target_appids.items():
+            # Try to find by appmanifest
+            appmanifest_path = library_path / f"appmanifest_{app_id}.acf"
+            if appmanifest_path.is_file():
+                # Find the installdir value
+                try:
+                    with open(appmanifest_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                        match = re.search(r'"installdir"\s+"([^"]+)"', content)
+                        if match:
+                            install_dir_name = match.group(1)
+                            install_path = common_dir / install_dir_name
+                            if install_path.is_dir():
+                                results[game_name] = install_path
+                except Exception as e:
+                    logger.warning(f"Error reading appmanifest for {game_name}: {e}")
+        return results
+
     @staticmethod
     def find_game_install_paths(target_appids: Dict[str, str]) -> Dict[str, Path]:
         """
         Find installation paths for multiple specified games using Steam app IDs.
         
+        Libraries are scanned concurrently (the work is stat/open bound); when a game
+        exists in several libraries the first library in the list still wins.
+
         Args:
             target_appids: Dictionary mapping game names to app IDs
             
@@ -672,45 +738,21 @@ class PathHandler:
             logger.warning("Failed to find any Steam library paths")
             return {}
         
+        if len(library_paths) == 1:
+            per_library = [PathHandler._scan_library_for_games(library_paths[0], target_appids)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(library_paths))) as executor:
+                per_library = list(executor.map(
+                    lambda lib: PathHandler._scan_library_for_games(lib, target_appids),
+                    library_paths
+                ))
+
         results = {}
-        
-        # For each library path, look for each target game
-        for library_path in library_paths:
-            # Check if the common directory exists
-            common_dir = library_path / "common"
-            if not common_dir.is_dir():
-                logger.debug(f"No 'common' directory in library: {library_path}")
-                continue
-            
-            # Get subdirectories in common dir
-            try:
-                game_dirs = [d for d in common_dir.iterdir() if d.is_dir()]
-            except (PermissionError, OSError) as e:
-                logger.warning(f"Cannot access directory {common_dir}: {e}")
-                continue
-            
-            # For each app ID, check if we find its directory
-            for game_name, app_id in target_appids.items():
-                if game_name in results:
-                    continue  # Already found this game
-                
-                # Try to find by appmanifest
-                appmanifest_path = library_path / f"appmanifest_{app_id}.acf"
-                if appmanifest_path.is_file():
-                    # Find the installdir value
-                    try:
-                        with open(appmanifest_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            match = re.search(r'"installdir"\s+"([^"]+)"', content)
-                            if match:
-                                install_dir_name = match.group(1)
-                                install_path = common_dir / install_dir_name
-                                if install_path.is_dir():
-                                    results[game_name] = install_path
-                                    logger.info(f"Found {game_name} at {install_path}")
-                                    continue
-                    except Exception as e:
-                        logger.warning(f"Error reading appmanifest for {game_name}: {e}")
+        for library_results in per_library:
+            for game_name, install_path in library_results.items():
+                if game_name not in results:
+                    results[game_name] = install_path
+                    logger.info(f"Found {game_name} at {install_path}")
         
         return results
 
@@ -8,7 +8,7 @@ import os
 import logging
 import vdf
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -45,6 +45,9 @@ class VDFHandler:
     """
     Safe handler for VDF operations with protection against modifying critical Steam files.
     """
+
+    # Parsed VDF files keyed by (path, binary) -> (mtime_ns, data), shared process-wide by load_cached()
+    _load_cache: Dict[Tuple[str, bool], Tuple[int, Dict[str, Any]]] = {}
     
     @staticmethod
     def is_protected_file(file_path: str) -> bool:
@@ -136,6 +139,44 @@ class VDFHandler:
             logger.error(f"Unexpected error loading VDF file {file_path}: {e}", exc_info=True)
             return None # Return None instead of {}
     
+    @classmethod
+    def load_cached(cls, file_path, binary: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Load a VDF file, reusing the previous parse while the file's mtime is unchanged.
+        
+        Read-only: unlike load(), no backup is made of protected files. The returned
+        dict is shared between callers and must not be modified.
+        
+        Args:
+            file_path: Path to the VDF file
+            binary: Whether the file is binary VDF format
+            
+        Returns:
+            Dict: Parsed VDF data, or None if the file could not be loaded
+        """
+        file_path = os.fspath(file_path)
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            logger.error(f"VDF file not found: {file_path}")
+            return None
+        key = (file_path, binary)
+        cached = cls._load_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            if binary:
+                with open(file_path, 'rb') as f_vdf:
+                    data = vdf.binary_loads(f_vdf.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f_text:
+                    data = vdf.load(f_text)
+        except Exception as e:
+            logger.error(f"Unexpected error loading VDF file {file_path}: {e}", exc_info=True)
+            return None
+        cls._load_cache[key] = (mtime_ns, data)
+        return data
+    
     @staticmethod
     def save(file_path: str, data: Dict[str, Any], binary: bool = True) -> bool:
         """
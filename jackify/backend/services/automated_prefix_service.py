@@ -6,8 +6,10 @@ This service implements the automated Proton prefix creation workflow
 that eliminates the need for manual steps in Jackify.
 """
 import os
+import re
 import sys
 import time
+import functools
 import subprocess
 import logging
 from pathlib import Path
@@ -16,13 +18,46 @@ import vdf
 
 logger = logging.getLogger(__name__)
 
+# "Non-Steam shortcut: <name> (<appid>)" lines in `protontricks -l` output
+_PROTONTRICKS_SHORTCUT_RE = re.compile(r'Non-Steam shortcut:\s+(.+?)\s+\((\d+)\)')
+
+# debug_mode setting, read from the config once per process
+_DEBUG = None
+
+def _debug_enabled() -> bool:
+    """Whether debug mode is enabled (ConfigHandler is only consulted on the first call)"""
+    global _DEBUG
+    if _DEBUG is None:
+        from jackify.backend.handlers.config_handler import ConfigHandler
+        _DEBUG = bool(ConfigHandler().get('debug_mode', False))
+    return _DEBUG
+
 def debug_print(message):
     """Print debug message only if debug mode is enabled"""
-    from jackify.backend.handlers.config_handler import ConfigHandler
-    config_handler = ConfigHandler()
-    if config_handler.get('debug_mode', False):
+    if _debug_enabled():
         print(message)
 
+@functools.lru_cache(maxsize=1)
+def _compat_mounts_for(libraryfolders_stamp: Tuple) -> str:
+    """
+    Colon-joined resolved paths of the Steam libraries other than the main one, for STEAM_COMPAT_MOUNTS
+    ('' when there are none). Keyed by PathHandler.get_libraryfolders_vdf_stamp() so library changes
+    are picked up.
+    """
+    from ..handlers.path_handler import PathHandler
+    main_steam_lib_path = PathHandler.find_steam_library()
+    if main_steam_lib_path and main_steam_lib_path.name == "common":
+        main_steam_lib_path = main_steam_lib_path.parent.parent
+    if not main_steam_lib_path:
+        return ""
+    main_resolved = main_steam_lib_path.resolve()
+    mount_paths = []
+    for lib_path in PathHandler.get_all_steam_library_paths():
+        resolved = lib_path.resolve()
+        if resolved != main_resolved:
+            mount_paths.append(str(resolved))
+    return ':'.join(mount_paths)
+
 class AutomatedPrefixService:
     """
     Service for automated Proton prefix creation using temporary batch files
@@ -33,6 +68,12 @@ class AutomatedPrefixService:
         self.scripts_dir = Path.home() / "Jackify/scripts"
         self.scripts_dir.mkdir(parents=True, exist_ok=True)
         # Use shared timing for consistency across services
+        # Parsed shortcuts.vdf keyed by (path, st_mtime_ns, st_size); see _load_shortcuts
+        self._shortcuts_cache: Optional[Tuple[Tuple[str, int, int], Dict]] = None
+        # AppName -> [(index key, shortcut)] for the cached parse, under the same key
+        self._shortcuts_index: Optional[Tuple[Tuple[str, int, int], Dict[str, List[Tuple[str, Dict]]]]] = None
+        # create_temp_batch_file results per shortcut name
+        self._batch_files: Dict[str, str] = {}
     
     def _get_progress_timestamp(self):
         """Get consistent progress timestamp"""
@@ -121,18 +162,10 @@ class AutomatedPrefixService:
                 launch_options = "%command%"
                 try:
                     from ..handlers.path_handler import PathHandler
-                    path_handler = PathHandler()
-                    
-                    all_libs = path_handler.get_all_steam_library_paths()
-                    main_steam_lib_path_obj = path_handler.find_steam_library()
-                    if main_steam_lib_path_obj and main_steam_lib_path_obj.name == "common":
-                        main_steam_lib_path = main_steam_lib_path_obj.parent.parent
-                        
-                        filtered_libs = [lib for lib in all_libs if str(lib) != str(main_steam_lib_path)]
-                        if filtered_libs:
-                            mount_paths = ":".join(str(lib) for lib in filtered_libs)
-                            launch_options = f'STEAM_COMPAT_MOUNTS="{mount_paths}" %command%'
-                            logger.info(f"Generated launch options with mounts: {launch_options}")
+                    mount_paths = _compat_mounts_for(PathHandler.get_libraryfolders_vdf_stamp())
+                    if mount_paths:
+                        launch_options = f'STEAM_COMPAT_MOUNTS="{mount_paths}" %command%'
+                        logger.info(f"Generated launch options with mounts: {launch_options}")
                 except Exception as e:
                     logger.warning(f"Could not generate STEAM_COMPAT_MOUNTS, using default: {e}")
                     launch_options = "%command%"
@@ -194,22 +227,8 @@ class AutomatedPrefixService:
         # Generate STEAM_COMPAT_MOUNTS if multiple libraries exist
         compat_mounts_str = ""
         try:
-            all_libs = PathHandler.get_all_steam_library_paths()
-            main_steam_lib_path_obj = PathHandler.find_steam_library()
-            if main_steam_lib_path_obj and main_steam_lib_path_obj.name == "common":
-                main_steam_lib_path = main_steam_lib_path_obj.parent.parent
-            else:
-                main_steam_lib_path = main_steam_lib_path_obj
-                
-            mount_paths = []
-            if main_steam_lib_path:
-                main_resolved = main_steam_lib_path.resolve()
-                for lib_path in all_libs:
-                    if lib_path.resolve() != main_resolved:
-                        mount_paths.append(str(lib_path.resolve()))
-                        
-            if mount_paths:
-                mount_paths_str = ':'.join(mount_paths)
+            mount_paths_str = _compat_mounts_for(PathHandler.get_libraryfolders_vdf_stamp())
+            if mount_paths_str:
                 compat_mounts_str = f'STEAM_COMPAT_MOUNTS="{mount_paths_str}"'
                 logger.info(f"Added STEAM_COMPAT_MOUNTS for {special_game_type.upper()}")
         except Exception as e:
@@ -252,15 +271,11 @@ class AutomatedPrefixService:
             if not shortcuts_path:
                 return True  # No shortcuts file, no conflict
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
-            
-            shortcuts = shortcuts_data.get('shortcuts', {})
+            name_index = self._load_shortcuts_index(shortcuts_path)
             conflicts = []
             
-            # Look for shortcuts with the same name AND path
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
+            # Look for shortcuts with the same name AND path (only the exact-name bucket can match)
+            for idx_str, shortcut in name_index.get(shortcut_name, ()):
                 name = shortcut.get('AppName', '')
                 shortcut_exe = shortcut.get('Exe', '').strip('"')  # Remove quotes
                 shortcut_startdir = shortcut.get('StartDir', '').strip('"')  # Remove quotes
@@ -273,7 +288,7 @@ class AutomatedPrefixService:
                 
                 if (name_matches and (exe_matches or startdir_matches)):
                     conflicts.append({
-                        'index': i,
+                        'index': int(idx_str),
                         'name': name,
                         'exe': shortcut_exe,
                         'startdir': shortcut_startdir
@@ -324,6 +339,82 @@ class AutomatedPrefixService:
         
         return message
     
+    def _load_shortcuts(self, shortcuts_path: Path) -> Dict:
+        """Parse shortcuts.vdf, reusing the previous parse while the file's mtime and size are unchanged."""
+        st = os.stat(shortcuts_path)
+        key = (os.fspath(shortcuts_path), st.st_mtime_ns, st.st_size)
+        if self._shortcuts_cache is not None and self._shortcuts_cache[0] == key:
+            return self._shortcuts_cache[1]
+        with open(shortcuts_path, 'rb') as f:
+            shortcuts_data = vdf.binary_load(f)
+        self._shortcuts_cache = (key, shortcuts_data)
+        return shortcuts_data
+
+    def _store_shortcuts(self, shortcuts_path: Path, shortcuts_data: Dict) -> None:
+        """Write shortcuts.vdf and keep the written data as the cached parse."""
+        try:
+            with open(shortcuts_path, 'wb') as f:
+                vdf.binary_dump(shortcuts_data, f)
+        except Exception:
+            self._invalidate_shortcuts_cache()
+            raise
+        st = os.stat(shortcuts_path)
+        self._shortcuts_cache = ((os.fspath(shortcuts_path), st.st_mtime_ns, st.st_size), shortcuts_data)
+        self._shortcuts_index = None
+
+    def _append_shortcut(self, shortcuts_path: Path, shortcuts_data: Dict, next_index: str, new_shortcut: Dict) -> None:
+        """
+        Add new_shortcut to shortcuts.vdf under next_index.
+
+        When the index is new, only the entry itself is serialized and spliced in front of the file's
+        two closing BIN_END markers (end of 'shortcuts', end of root), written atomically. Anything
+        unexpected falls back to a full rewrite via _store_shortcuts.
+        """
+        shortcuts = shortcuts_data.setdefault('shortcuts', {})
+        can_splice = next_index not in shortcuts
+        shortcuts[next_index] = new_shortcut
+        if can_splice:
+            with open(shortcuts_path, 'rb') as f:
+                raw = f.read()
+            # binary_dumps closes its own root map with one BIN_END, which the file already provides
+            entry = vdf.binary_dumps({next_index: new_shortcut})
+            if raw[:11].lower() == b'\x00shortcuts\x00' and raw.endswith(b'\x08\x08') and entry.endswith(b'\x08'):
+                tmp_path = shortcuts_path.with_name(shortcuts_path.name + '.tmp')
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(raw[:-2] + entry[:-1] + raw[-2:])
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, shortcuts_path)
+                except Exception:
+                    self._invalidate_shortcuts_cache()
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+                st = os.stat(shortcuts_path)
+                self._shortcuts_cache = ((os.fspath(shortcuts_path), st.st_mtime_ns, st.st_size), shortcuts_data)
+                self._shortcuts_index = None
+                return
+        self._store_shortcuts(shortcuts_path, shortcuts_data)
+
+    def _load_shortcuts_index(self, shortcuts_path: Path) -> Dict[str, List[Tuple[str, Dict]]]:
+        """AppName -> [(index key, shortcut), ...] in file order, built once per cached shortcuts.vdf parse."""
+        shortcuts_data = self._load_shortcuts(shortcuts_path)
+        cache_key = self._shortcuts_cache[0]
+        if self._shortcuts_index is None or self._shortcuts_index[0] != cache_key:
+            index: Dict[str, List[Tuple[str, Dict]]] = {}
+            for idx_str, shortcut in shortcuts_data.get('shortcuts', {}).items():
+                index.setdefault(shortcut.get('AppName', ''), []).append((idx_str, shortcut))
+            self._shortcuts_index = (cache_key, index)
+        return self._shortcuts_index[1]
+
+    def _invalidate_shortcuts_cache(self) -> None:
+        """Forget the cached shortcuts.vdf parse and its name index."""
+        self._shortcuts_cache = None
+        self._shortcuts_index = None
+
     def _get_shortcuts_path(self) -> Optional[Path]:
         """Get the path to shortcuts.vdf using proper Steam path detection."""
         try:
@@ -382,6 +473,10 @@ class AutomatedPrefixService:
         Returns:
             Path to the created batch file, or None if failed
         """
+        # Reuse the file already created for this shortcut in this session
+        existing = self._batch_files.get(shortcut_name)
+        if existing and os.path.isfile(existing):
+            return existing
         try:
             # Create a unique batch file name
             timestamp = int(time.time())
@@ -406,6 +501,7 @@ exit"""
             os.chmod(str(batch_path), 0o755)
             
             logger.info(f"Created temporary batch file: {batch_path}")
+            self._batch_files[shortcut_name] = str(batch_path)
             return str(batch_path)
             
         except Exception as e:
@@ -451,26 +547,24 @@ exit"""
             if not shortcuts_path:
                 return None
             
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            name_index = self._load_shortcuts_index(shortcuts_path)
             
-            shortcuts = shortcuts_data.get('shortcuts', {})
+            # Look for our shortcut by name; an exact name match wins over the first partial match
+            entries = name_index.get(shortcut_name)
+            if not entries:
+                entries = next((bucket for name, bucket in name_index.items() if shortcut_name in name), None)
+            found = entries[0][1] if entries else None
             
-            # Look for our shortcut by name
-            for i in range(len(shortcuts)):
-                shortcut = shortcuts[str(i)]
-                name = shortcut.get('AppName', '')
+            if found is not None:
+                appid = found.get('appid')
+                exe_path = found.get('Exe', '').strip('"')
                 
-                if shortcut_name in name:
-                    appid = shortcut.get('appid')
-                    exe_path = shortcut.get('Exe', '').strip('"')
-                    
-                    logger.info(f"Found shortcut: {name}")
-                    logger.info(f"  AppID: {appid}")
-                    logger.info(f"  Exe: {exe_path}")
-                    logger.info(f"  CompatTool: {shortcut.get('CompatTool', 'NOT_SET')}")
-                    
-                    return appid
+                logger.info(f"Found shortcut: {found.get('AppName', '')}")
+                logger.info(f"  AppID: {appid}")
+                logger.info(f"  Exe: {exe_path}")
+                logger.info(f"  CompatTool: {found.get('CompatTool', 'NOT_SET')}")
+                
+                return appid
             
             logger.error(f"Shortcut '{shortcut_name}' not found")
             return None
@@ -482,7 +576,8 @@ exit"""
     def detect_actual_prefix_appid(self, initial_appid: int, shortcut_name: str) -> Optional[int]:
         """
         After Steam restart, detect the actual prefix AppID that was created.
-        Use protontricks -l to find the actual positive AppID.
+        Polls compatdata for the unsigned form of the initial AppID first, then
+        falls back to protontricks -l to find the actual positive AppID.
         
         Args:
             initial_appid: The initial (negative) AppID from shortcuts.vdf
@@ -492,30 +587,45 @@ exit"""
             The actual (positive) AppID of the created prefix, or None if not found
         """
         try:
+            # The prefix directory is named after the unsigned form of the shortcut's AppID, so a stat
+            # per second usually finds it without spawning protontricks
+            expected_appid = self.generate_steam_short_id(initial_appid)
+            compatdata_candidates = [
+                os.path.join(os.path.expanduser(base), "steamapps", "compatdata", str(expected_appid))
+                for base in ("~/.steam/steam", "~/.local/share/Steam",
+                             "~/.var/app/com.valvesoftware.Steam/home/.steam/steam",
+                             "~/.var/app/com.valvesoftware.Steam/home/.local/share/Steam")
+            ]
+            stat_polls = 5
+            for i in range(stat_polls):
+                for candidate in compatdata_candidates:
+                    if os.path.isdir(candidate):
+                        logger.info(f" Found prefix directory for shortcut '{shortcut_name}': {candidate}")
+                        logger.info(f"  Initial AppID: {initial_appid}")
+                        logger.info(f"  Actual AppID: {expected_appid}")
+                        return expected_appid
+                logger.debug(f"Prefix for AppID {expected_appid} not present yet (poll {i+1}/{stat_polls})")
+                time.sleep(1)
+
             logger.info(f"Using protontricks -l to detect actual AppID for shortcut: {shortcut_name}")
+            from jackify.backend.handlers.protontricks_handler import ProtontricksHandler
+            from .steam_restart_service import is_steam_deck
+            protontricks_handler = ProtontricksHandler(is_steam_deck())
             
-            # Wait up to 30 seconds for the shortcut to appear in protontricks
-            for i in range(30):
+            # Wait up to 30 seconds in total for the shortcut to appear in protontricks
+            for i in range(stat_polls, 30):
                 try:
-                    # Use the existing protontricks handler
-                    from jackify.backend.handlers.protontricks_handler import ProtontricksHandler
-                    protontricks_handler = ProtontricksHandler(steamdeck or False)
                     result = protontricks_handler.run_protontricks('-l')
                     
                     if result.returncode == 0:
-                        lines = result.stdout.strip().split('\n')
-                        
-                        # Look for our shortcut name in the protontricks output
-                        for line in lines:
-                            if shortcut_name in line and 'Non-Steam shortcut:' in line:
-                                # Extract AppID from line like "Non-Steam shortcut: Tuxborn (3106560878)"
-                                if '(' in line and ')' in line:
-                                    appid_str = line.split('(')[1].split(')')[0]
-                                    actual_appid = int(appid_str)
-                                    logger.info(f" Found shortcut in protontricks: {line.strip()}")
-                                    logger.info(f"  Initial AppID: {initial_appid}")
-                                    logger.info(f"  Actual AppID: {actual_appid}")
-                                    return actual_appid
+                        # Look for our shortcut name in lines like "Non-Steam shortcut: Tuxborn (3106560878)"
+                        for match in _PROTONTRICKS_SHORTCUT_RE.finditer(result.stdout):
+                            if shortcut_name in match.group(1):
+                                actual_appid = int(match.group(2))
+                                logger.info(f" Found shortcut in protontricks: {match.group(0)}")
+                                logger.info(f"  Initial AppID: {initial_appid}")
+                                logger.info(f"  Actual AppID: {actual_appid}")
+                                return actual_appid
                     
                     logger.debug(f"Shortcut '{shortcut_name}' not found in protontricks yet (attempt {i+1}/30)")
                     time.sleep(1)
@@ -585,7 +695,8 @@ exit"""
             
             # Launch using rungameid
             cmd = ['steam', f'steam://rungameid/{rungameid}']
-            debug_print(f"[DEBUG] About to run launch command: {' '.join(cmd)}")
+            if _debug_enabled():
+                debug_print(f"[DEBUG] About to run launch command: {' '.join(cmd)}")
             
             # Use subprocess.Popen to launch asynchronously (steam command returns immediately)
             process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
@@ -605,9 +716,9 @@ exit"""
                 
                 # Get any output
                 stdout, stderr = process.communicate(timeout=1)
-                if stdout:
+                if stdout and _debug_enabled():
                     debug_print(f"[DEBUG] Steam launch stdout: {stdout}")
-                if stderr:
+                if stderr and _debug_enabled():
                     debug_print(f"[DEBUG] Steam launch stderr: {stderr}")
                     
             except subprocess.TimeoutExpired:
@@ -651,20 +762,17 @@ exit"""
                 return False
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = self._load_shortcuts(shortcuts_path)
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
             # Find the next available index
             next_index = str(len(shortcuts))
             
-            # Calculate AppID for the new shortcut (negative for non-Steam shortcuts)
-            import hashlib
-            app_name_bytes = shortcut_name.encode('utf-8')
-            exe_bytes = exe_path.encode('utf-8')
-            combined = app_name_bytes + exe_bytes
-            hash_value = int(hashlib.md5(combined).hexdigest()[:8], 16)
+            # Calculate AppID for the new shortcut (negative for non-Steam shortcuts), using the same
+            # CRC32 of exe_path + shortcut_name as create_shortcut_directly_with_proton
+            from zlib import crc32
+            hash_value = crc32((exe_path + shortcut_name).encode('utf-8'))
             appid = -(hash_value & 0x7FFFFFFF)  # Make it negative and within 32-bit range
             
             # Create new shortcut entry
@@ -689,17 +797,15 @@ exit"""
                 'IsInstalled': 1  # Make it appear in "Locally Installed" filter
             }
             
-            # Add the new shortcut
-            shortcuts[next_index] = new_shortcut
-            
-            # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            # Add the new shortcut and write it back to file
+            self._append_shortcut(shortcuts_path, shortcuts_data, next_index, new_shortcut)
             
             logger.info(f"Created shortcut directly: {shortcut_name}")
             return True
             
         except Exception as e:
+            # The cached parse may have been modified in place without being written
+            self._invalidate_shortcuts_cache()
             logger.error(f"Error creating shortcut directly: {e}")
             return False
 
@@ -738,16 +844,19 @@ timeout /t 3 /nobreak >nul
 echo Prefix creation complete.
 """
             batch_path = Path.home() / "Jackify/temp_prefix_creation.bat"
-            batch_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(batch_path, 'w') as f:
-                f.write(batch_content)
-            
-            debug_print(f"[DEBUG] Created temporary batch file: {batch_path}")
+            # The shortcut's Exe points at this file, but its content never changes: only write it when missing or stale
+            try:
+                batch_up_to_date = batch_path.read_text() == batch_content
+            except OSError:
+                batch_up_to_date = False
+            if not batch_up_to_date:
+                batch_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(batch_path, 'w') as f:
+                    f.write(batch_content)
+                debug_print(f"[DEBUG] Created temporary batch file: {batch_path}")
             
             # Read current shortcuts
-            with open(shortcuts_path, 'rb') as f:
-                shortcuts_data = vdf.binary_load(f)
+            shortcuts_data = self._load_shortcuts(shortcuts_path)
             
             shortcuts = shortcuts_data.get('shortcuts', {})
             
@@ -798,12 +907,15 @@ echo Prefix creation complete.
                 }
                 new_shortcuts_list.append(new_shortcut)
             
-            # Rebuild shortcuts dict with new order
-            shortcuts_data['shortcuts'] = {str(i): s for i, s in enumerate(new_shortcuts_list)}
-            
-            # Write back to file
-            with open(shortcuts_path, 'wb') as f:
-                vdf.binary_dump(shortcuts_data, f)
+            if not found and list(shortcuts) == [str(i) for i in range(len(shortcuts))]:
+                # Keys are already 0..n-1, so re-indexing would change nothing: append just the new entry
+                self._append_shortcut(shortcuts_path, shortcuts_data, str(len(shortcuts)), new_shortcut)
+            else:
+                # Rebuild shortcuts dict with new order
+                shortcuts_data['shortcuts'] = {str(i): s for i, s in enumerate(new_shortcuts_list)}
+                
+                # Write back to file
+                self._store_shortcuts(shortcuts_path, shortcuts_data)
             
             logger.info(f"Created/updated shortcut with temporary batch file: {shortcut_name} with AppID {appid}")
             debug_print(f"[DEBUG] Shortcut created/updated with temporary batch file, AppID {appid}")
@@ -817,6 +929,8 @@ echo Prefix creation complete.
                 return False
             
         except Exception as e:
+            # The cached parse may have been modified in place without being written
+            self._invalidate_shortcuts_cache()
             logger.error(f"Error creating shortcut with temporary batch file: {e}")
             return False
     
@@ -1433,7 +1547,8 @@ echo Prefix creation complete.
         Returns:
             Tuple of (success, prefix_path, appid)
         """
-        debug_print(f"[DEBUG] run_complete_workflow called with shortcut_name={shortcut_name}, modlist_install_dir={modlist_install_dir}, final_exe_path={final_exe_path}")
+        if _debug_enabled():
+            debug_print(f"[DEBUG] run_complete_workflow called with shortcut_name={shortcut_name}, modlist_install_dir={modlist_install_dir}, final_exe_path={final_exe_path}")
         logger.info("Starting simple automated prefix creation workflow")
         
         # Initialize shared timing to continue from jackify-engine
@@ -2564,17 +2679,21 @@ echo Prefix creation complete.
 
         # Fallback to manual detection
         steam_userdata_path = Path.home() / ".steam" / "steam" / "userdata"
-        if steam_userdata_path.exists():
-            user_dirs = [d for d in steam_userdata_path.iterdir() if d.is_dir() and d.name.isdigit() and d.name != "0"]
-            if user_dirs:
-                # Use most recently modified directory as fallback
-                try:
-                    most_recent = max(user_dirs, key=lambda d: d.stat().st_mtime)
-                    localconfig_path = most_recent / "config" / "localconfig.vdf"
-                    if localconfig_path.exists():
-                        return str(localconfig_path)
-                except Exception:
-                    pass
+        # DirEntry.is_dir() uses the type from the directory listing, so only the numeric names get a stat
+        try:
+            with os.scandir(steam_userdata_path) as it:
+                user_dirs = [entry for entry in it if entry.name.isdigit() and entry.name != "0" and entry.is_dir()]
+        except OSError:
+            user_dirs = []
+        if user_dirs:
+            # Use most recently modified directory as fallback
+            try:
+                most_recent = max(user_dirs, key=lambda entry: entry.stat().st_mtime)
+                localconfig_path = Path(most_recent.path) / "config" / "localconfig.vdf"
+                if localconfig_path.exists():
+                    return str(localconfig_path)
+            except Exception:
+                pass
         
         logger.error("Could not find localconfig.vdf")
         return None
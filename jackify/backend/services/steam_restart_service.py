@@ -217,6 +217,10 @@ def robust_steam_restart(progress_callback: Optional[Callable[[str], None]] = No
     
     report("Steam closed successfully.")
 
+    # Library folders may change across a restart, so drop the cached lookup
+    from ..handlers.path_handler import PathHandler
+    PathHandler.clear_steam_library_cache()
+
     # Start Steam using platform-specific logic
     report("Starting Steam...")
     
@@ -11,6 +11,7 @@ import signal
 import logging
 
 from .main import JackifyCLI
+from jackify.backend.handlers.modlist_handler import install_signal_handlers
 
 # Set up logging
 logging.basicConfig(
@@ -25,7 +26,8 @@ def terminate_children(signum, frame):
 
 def main():
     """Main entry point for the CLI frontend"""
-    # Set up signal handlers
+    # Set up signal handlers (terminal restore first; SIGTERM/SIGINT are then overridden below)
+    install_signal_handlers()
     signal.signal(signal.SIGTERM, terminate_children)
     signal.signal(signal.SIGINT, terminate_children)
     